@@ -0,0 +1,51 @@
+"""Add indexes for the admin feedback listing
+
+Revision ID: 018_add_feedback_admin_indexes
+Revises: 017_add_pull_requests_table
+Create Date: 2025-01-27 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '018_add_feedback_admin_indexes'
+down_revision = '017_add_pull_requests_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add indexes matching the sort orders and filters of get_admin_feedback"""
+
+    # Sort indexes: get_admin_feedback orders by (created_at, id) or (rating, id)
+    # and seeks past a keyset cursor on the same columns, so pages can be read
+    # straight off the index in either direction
+    print("Creating index idx_user_feedback_created_id on user_feedback(created_at, id)...")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_feedback_created_id "
+        "ON user_feedback (created_at, id)"
+    )
+
+    print("Creating index idx_user_feedback_rating_id on user_feedback(rating, id)...")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_feedback_rating_id "
+        "ON user_feedback (rating, id)"
+    )
+
+    # Target filter: snippet_id and page_id are already indexed (016); rewritten
+    # document feedback is sparse, so a partial index keeps it small
+    print("Creating partial index idx_user_feedback_rewritten_document_id on user_feedback(rewritten_document_id)...")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_feedback_rewritten_document_id "
+        "ON user_feedback (rewritten_document_id) "
+        "WHERE rewritten_document_id IS NOT NULL"
+    )
+
+    print("Admin feedback indexes created successfully")
+
+
+def downgrade():
+    """Remove admin feedback indexes"""
+    op.drop_index('idx_user_feedback_rewritten_document_id', 'user_feedback')
+    op.drop_index('idx_user_feedback_rating_id', 'user_feedback')
+    op.drop_index('idx_user_feedback_created_id', 'user_feedback')
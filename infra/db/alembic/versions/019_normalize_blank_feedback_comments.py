@@ -0,0 +1,44 @@
+"""Store blank feedback comments as NULL
+
+Revision ID: 019_normalize_blank_feedback_comments
+Revises: 018_add_feedback_admin_indexes
+Create Date: 2025-01-27 13:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '019_normalize_blank_feedback_comments'
+down_revision = '018_add_feedback_admin_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Normalize comments so 'has a comment' is a plain NULL check"""
+
+    # The UserFeedback model now strips comments and stores blank ones as NULL;
+    # bring existing rows in line before enforcing it
+    print("Normalizing blank and padded user_feedback comments...")
+    op.execute(
+        "UPDATE user_feedback SET comment = NULL "
+        "WHERE length(btrim(comment, E' \\t\\r\\n')) = 0"
+    )
+    op.execute(
+        "UPDATE user_feedback SET comment = btrim(comment, E' \\t\\r\\n') "
+        "WHERE comment <> btrim(comment, E' \\t\\r\\n')"
+    )
+
+    print("Adding check constraint check_feedback_comment_not_blank...")
+    op.create_check_constraint(
+        'check_feedback_comment_not_blank',
+        'user_feedback',
+        "comment IS NULL OR length(trim(comment)) > 0"
+    )
+
+    print("Feedback comments normalized successfully")
+
+
+def downgrade():
+    """Remove the blank comment check constraint (normalized data is kept)"""
+    op.drop_constraint('check_feedback_comment_not_blank', 'user_feedback', type_='check')
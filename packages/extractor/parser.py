@@ -2,27 +2,41 @@
 # Uses BeautifulSoup to extract <pre> blocks and their context from HTML.
 
 from bs4 import BeautifulSoup
-import re
+
+# Tag lists and tab markers shared by every <pre> block on a page
+_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+_SECTION_TAGS = ['section', 'article', 'div']
+_AZURE_POWERSHELL_TAB = "azure-powershell"
 
 
 def extract_code_snippets(html):
     soup = BeautifulSoup(html, 'html.parser')
     snippets = []
+    # <pre> blocks often share a section or parent; keyed by id() so each
+    # container's heading and text are extracted once per page, not per block
+    section_headings = {}
+    parent_lines = {}
     for pre in soup.find_all('pre'):
         context = ''
-        parent = pre.find_parent(['section', 'article', 'div'])
+        parent = pre.find_parent(_SECTION_TAGS)
         if parent:
-            heading = parent.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            if heading:
-                context = heading.get_text(strip=True)
+            if id(parent) not in section_headings:
+                heading = parent.find(_HEADING_TAGS)
+                section_headings[id(parent)] = heading.get_text(strip=True) if heading else ''
+            context = section_headings[id(parent)]
         if not context:
-            prev = pre.find_previous(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+            prev = pre.find_previous(_HEADING_TAGS)
             if prev:
                 context = prev.get_text(strip=True)
         code = pre.get_text('\n', strip=True)
         # Get a broader context excerpt (up to 25 lines around the <pre> block)
-        lines = pre.parent.get_text('\n', strip=True).split('\n') if pre.parent else []
-        pre_text = pre.get_text('\n', strip=True)
+        # The snippet's own text is the code extracted above
+        lines = []
+        if pre.parent:
+            if id(pre.parent) not in parent_lines:
+                parent_lines[id(pre.parent)] = pre.parent.get_text('\n', strip=True).split('\n')
+            lines = parent_lines[id(pre.parent)]
+        pre_text = code
         if lines and pre_text in lines:
             idx = lines.index(pre_text)
             start = max(0, idx - 12)
@@ -36,7 +50,7 @@ def extract_code_snippets(html):
         # Check if under Azure PowerShell tab
         under_az_powershell_tab = False
         tab_parent = pre.find_parent(attrs={"data-tab": True})
-        if tab_parent and tab_parent.get("data-tab", "").lower() == "azure-powershell":
+        if tab_parent and tab_parent.get("data-tab", "").lower() == _AZURE_POWERSHELL_TAB:
             under_az_powershell_tab = True
         # Check if context/header contains 'windows'
         windows_header = False
@@ -3,6 +3,22 @@
 # Used for both snippet-level and page-level heuristic scanning.
 
 import re
+from functools import lru_cache
+from typing import Set
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """
+    Lowercase the literal text of a regex, leaving backslash escapes as written.
+
+    Patterns are matched against lowercased text, but escapes are case
+    sensitive (\\S is not \\s), so only the text between escapes is folded.
+    """
+    return re.sub(
+        r'\\.|[^\\]+',
+        lambda m: m.group() if m.group().startswith('\\') else m.group().lower(),
+        pattern,
+    )
 
 
 # Patterns to detect Windows-specific content in full page prose/code
@@ -27,6 +43,27 @@ PROSE_WINDOWS_PATTERNS = [
     r'Windows Registry',
 ]
 
+# Prose patterns compiled into a single alternation so a page is scanned once
+# instead of once per pattern. Pages are lowercased once per call and matched
+# against lowercased patterns, which is cheaper than IGNORECASE folding every
+# character during the scan
+_PROSE_WINDOWS_RE = re.compile(
+    '|'.join(f'(?:{_lowercase_pattern(pattern)})' for pattern in PROSE_WINDOWS_PATTERNS)
+)
+
+# Bytes twin of _PROSE_WINDOWS_RE for ASCII-only pages, which the bytes engine
+# scans faster. Only used when the page is pure ASCII: bytes \b treats any
+# non-ASCII byte as a non-word character, which would change what matches
+_PROSE_WINDOWS_BYTES_RE = re.compile(_PROSE_WINDOWS_RE.pattern.encode('ascii'))
+
+# Every prose pattern is a literal, optionally wrapped in \b, so a page can only
+# match if it contains one of these strings. Plain substring checks run far
+# faster than the regex scan and reject most pages before it is needed
+_PROSE_WINDOWS_LITERALS = tuple(
+    re.sub(r'\\(.)', r'\1', pattern.replace(r'\b', '')).lower()
+    for pattern in PROSE_WINDOWS_PATTERNS
+)
+
 
 # Patterns for detecting intentionally Windows-focused page titles
 # Used to skip scoring for pages that are clearly about Windows-specific topics
@@ -47,7 +84,24 @@ WINDOWS_FOCUSED_TITLE_PATTERNS = [
     r'\bChocolatey\b',                 # Chocolatey package manager
 ]
 
+# Matched against the lowercased title, like the prose patterns above
+_WINDOWS_FOCUSED_TITLE_RE = re.compile(
+    '|'.join(f'(?:{_lowercase_pattern(pattern)})' for pattern in WINDOWS_FOCUSED_TITLE_PATTERNS)
+)
+
+# Substrings every title pattern needs (lowercased); most titles contain none of
+# them and are rejected without running the regex. "win" covers Windows, WinForms,
+# winget and the win20xx versions. Keep in sync with WINDOWS_FOCUSED_TITLE_PATTERNS
+_WINDOWS_FOCUSED_TITLE_LITERALS = (
+    'win', 'powershell', 'iis', '.net framework', 'wcf', 'wpf',
+    'active directory', 'ad ds', 'hyper-v', 'chocolatey',
+)
+
 
+# Titles are short and recur on every scan of the same docs tree, so cache the
+# verdict per title (page bodies are not cached: they are large and unchanged
+# pages are already skipped by content hash)
+@lru_cache(maxsize=4096)
 def is_windows_intentional_title(title: str) -> bool:
     """
     Check if a page title indicates intentionally Windows-focused documentation.
@@ -64,10 +118,11 @@ def is_windows_intentional_title(title: str) -> bool:
     if not title:
         return False
 
-    for pattern in WINDOWS_FOCUSED_TITLE_PATTERNS:
-        if re.search(pattern, title, re.IGNORECASE):
-            return True
-    return False
+    title = title.lower()
+    if not any(literal in title for literal in _WINDOWS_FOCUSED_TITLE_LITERALS):
+        return False
+    # A literal is present; confirm it with the word boundaries
+    return _WINDOWS_FOCUSED_TITLE_RE.search(title) is not None
 
 
 def page_has_windows_signals(page_content: str) -> bool:
@@ -86,66 +141,123 @@ def page_has_windows_signals(page_content: str) -> bool:
     if not page_content:
         return False
 
-    for pattern in PROSE_WINDOWS_PATTERNS:
-        if re.search(pattern, page_content, re.IGNORECASE):
-            return True
-    return False
+    content = page_content.lower()
+    if not any(literal in content for literal in _PROSE_WINDOWS_LITERALS):
+        return False
+    # A literal is present; confirm it with the word boundaries. Encoding an
+    # ASCII-only str is a plain copy, and isascii() is a flag check
+    if content.isascii():
+        return _PROSE_WINDOWS_BYTES_RE.search(content.encode('ascii')) is not None
+    return _PROSE_WINDOWS_RE.search(content) is not None
 
-def is_windows_biased(snippet):
+
+# Patterns for Windows prompts, PowerShell, and Windows-only tools in code snippets
+WINDOWS_CODE_PATTERNS = [
+    r'^\s*C:\\',  # Windows path
+    r'\\',        # Backslash in path
+    r'cmd\.exe',
+    r'powershell',
+    r'PS [A-Z]:',
+    r'\\Users\\',
+    r'net use',
+    r'icacls',
+    r'\bregedit\b',
+    r'\bchoco(\s|$)',
+    r'\bwinget(\s|$)',
+    r'\bSet-ExecutionPolicy\b',
+    r'\bGet-ChildItem\b',
+    r'\bNew-Item\b',
+    r'\bRemove-Item\b',
+    r'\bdir\b',
+    r'\bcopy\b',
+    r'\bdel\b',
+    r'\bcls\b',
+    r'\btype\b',
+    r'\bsc \b',
+    r'\bnet start\b',
+    r'\bnet stop\b',
+    r'\bmsiexec\b',
+    r'\btasklist\b',
+    r'\btaskkill\b',
+    r'\bshutdown\b',
+    r'\bexplorer.exe\b',
+]
+
+# All code patterns compiled into a single alternation so each snippet is
+# scanned once instead of once per pattern
+_WINDOWS_CODE_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in WINDOWS_CODE_PATTERNS),
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Substrings (lowercased) that every code pattern needs, in pattern order;
+# the backslash covers the path patterns. Most snippets contain none of them
+# and are rejected without the regex scan. Keep in sync with
+# WINDOWS_CODE_PATTERNS
+_WINDOWS_CODE_LITERALS = (
+    '\\', 'cmd.exe', 'powershell', 'ps ', 'net use', 'icacls', 'regedit',
+    'choco', 'winget', 'set-executionpolicy', 'get-childitem', 'new-item',
+    'remove-item', 'dir', 'copy', 'del', 'cls', 'type', 'sc ', 'net start',
+    'net stop', 'msiexec', 'tasklist', 'taskkill', 'shutdown', 'explorer',
+)
+
+
+def _has_windows_code(code: str) -> bool:
+    """Check a snippet's code against the Windows code patterns."""
+    lowered = code.lower()
+    if not any(literal in lowered for literal in _WINDOWS_CODE_LITERALS):
+        return False
+    # A literal is present; confirm it with the full patterns
+    return _WINDOWS_CODE_RE.search(code) is not None
+
+
+# Context keywords and URL path markers (lowercase) that put a snippet in an
+# explicitly Windows/PowerShell section. Plain substrings, so each check is
+# one lowercase copy plus a few `in` scans rather than a regex search
+_EXEMPT_CONTEXT_KEYWORDS = ('windows', 'powershell')
+_EXEMPT_URL_MARKERS = ('/windows/', '/powershell/', '/cmd/', '/cli-windows/', '/windows-')
+
+
+def _is_exempt_snippet(snippet) -> bool:
+    """Check whether a snippet sits in an explicitly Windows/PowerShell context."""
     # If the snippet is under an Azure PowerShell tab, do not flag as biased
     if snippet.get('under_az_powershell_tab'):
-        return False
+        return True
     # If the snippet is under a Windows header, do not flag as biased
     if snippet.get('windows_header'):
-        return False
+        return True
     context = snippet.get('context', '').lower()
-    url = snippet.get('url', '').lower() if 'url' in snippet else ''
-    if (
-        'windows' in context or
-        'powershell' in context or
-        '/windows/' in url or
-        '/powershell/' in url or
-        '/cmd/' in url or
-        '/cli-windows/' in url or
-        '/windows-' in url
-    ):
+    if any(keyword in context for keyword in _EXEMPT_CONTEXT_KEYWORDS):
+        return True
+    url = snippet.get('url', '').lower()
+    return any(marker in url for marker in _EXEMPT_URL_MARKERS)
+
+
+def is_windows_biased(snippet):
+    # Heuristic: look for Windows prompt, PowerShell, or Windows-only tools.
+    # Most snippets are Linux/cross-platform and fail this single scan, so it
+    # runs before the exemption checks, which only matter for flagged code
+    if not _has_windows_code(snippet['code']):
         return False
-    # Heuristic: look for Windows prompt, PowerShell, or Windows-only tools
-    windows_patterns = [
-        r'^\s*C:\\',  # Windows path
-        r'\\',        # Backslash in path
-        r'cmd\.exe',
-        r'powershell',
-        r'PS [A-Z]:',
-        r'\\Users\\',
-        r'net use',
-        r'icacls',
-        r'\bregedit\b',
-        r'\bchoco(\s|$)',
-        r'\bwinget(\s|$)',
-        r'\bSet-ExecutionPolicy\b',
-        r'\bGet-ChildItem\b',
-        r'\bNew-Item\b',
-        r'\bRemove-Item\b',
-        r'\bdir\b',
-        r'\bcopy\b',
-        r'\bdel\b',
-        r'\bcls\b',
-        r'\btype\b',
-        r'\bsc \b',
-        r'\bnet start\b',
-        r'\bnet stop\b',
-        r'\bmsiexec\b',
-        r'\btasklist\b',
-        r'\btaskkill\b',
-        r'\bshutdown\b',
-        r'\bexplorer.exe\b',
-    ]
-    for pat in windows_patterns:
-        if re.search(pat, snippet['code'], re.IGNORECASE|re.MULTILINE):
-            return True
-    return False
-    
+    return not _is_exempt_snippet(snippet)
+
+
+def bulk_is_windows_biased(snippets) -> Set[int]:
+    """
+    Run the snippet heuristic over a whole batch in one pass.
+
+    Args:
+        snippets: List of snippet dictionaries with 'code' and 'context'
+
+    Returns:
+        Set of indices into ``snippets`` that were flagged as Windows-biased
+    """
+    return {
+        idx for idx, snippet in enumerate(snippets)
+        if _has_windows_code(snippet['code']) and not _is_exempt_snippet(snippet)
+    }
+
+
 # Example usage:
 # for snip in snippets:
 #     if is_windows_biased(snip):
@@ -1,5 +1,7 @@
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.routing import APIRoute
 from pydantic import BaseModel
+import gzip
 import os
 import sys
 import time
@@ -13,7 +15,34 @@ from azure.identity import ManagedIdentityCredential
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from shared.utils.markdown_utils import extract_title_from_markdown
 
+
+class GzipRequest(Request):
+    """Request that transparently inflates gzip-encoded bodies"""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = await super().body()
+            if "gzip" in self.headers.getlist("Content-Encoding"):
+                body = gzip.decompress(body)
+            self._body = body
+        return self._body
+
+
+class GzipRoute(APIRoute):
+    """Route class that accepts Content-Encoding: gzip request bodies from workers"""
+
+    def get_route_handler(self):
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request):
+            request = GzipRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return custom_route_handler
+
+
 app = FastAPI()
+app.router.route_class = GzipRoute
 
 # AOAI config from environment
 AZURE_OPENAI_KEY = os.getenv("AZURE_OPENAI_KEY", "")
@@ -2,9 +2,9 @@ from fastapi import APIRouter, Request, Form, HTTPException, Cookie, Query
 from fastapi.responses import RedirectResponse, JSONResponse
 from jinja_env import templates
 from shared.utils.database import SessionLocal
-from shared.models import Scan, UserFeedback, Snippet, RewrittenDocument
-from sqlalchemy import text, func, case, or_, cast, Boolean
-from sqlalchemy.orm import joinedload
+from shared.models import Scan
+from sqlalchemy import text, cast, Boolean
+from utils.feedback_queries import get_admin_feedback, invalidate_feedback_stats_cache
 from datetime import datetime, timedelta
 from typing import Optional
 import os
@@ -430,6 +430,7 @@ async def admin_wipe_database(request: Request, confirmation: str = Form(...), s
         db.execute(text("ALTER SEQUENCE scans_id_seq RESTART WITH 1"))
         
         db.commit()
+        invalidate_feedback_stats_cache()
         
         logging.info("Database successfully wiped - all data deleted, schema preserved")
         
@@ -447,148 +448,6 @@ async def admin_wipe_database(request: Request, confirmation: str = Form(...), s
         db.close()
 
 
-def get_admin_feedback(
-    db,
-    page: int = 1,
-    per_page: int = 25,
-    target_type: Optional[str] = None,
-    rating: Optional[str] = None,
-    has_comment: Optional[str] = None,
-    sort_by: str = "date",
-    sort_order: str = "desc"
-):
-    """
-    Query feedback with server-side pagination, filtering, and sorting.
-
-    Args:
-        db: Database session.
-        page: Page number (1-indexed).
-        per_page: Items per page (max 100).
-        target_type: Filter by target type (``"snippet"``, ``"page"``, ``"rewritten"``).
-        rating: Filter by rating (``"up"``, ``"down"``).
-        has_comment: Filter by comment presence (``"yes"``, ``"no"``).
-        sort_by: Sort field (e.g. ``"date"``, ``"rating"``).
-        sort_order: Sort direction (``"asc"``, ``"desc"``).
-
-    Returns:
-        dict: A dictionary containing the feedback data and metadata with at least
-            the following keys:
-
-            - ``"items"``: A list of feedback records for the current page.
-            - ``"pagination"``: A dictionary with pagination metadata, including:
-
-                - ``"page"``: The current page number (1-indexed).
-                - ``"per_page"``: The number of items per page.
-                - ``"total_items"``: The total number of feedback records matching
-                  the current filters.
-                - ``"total_pages"``: The total number of pages available for the
-                  current filters and ``per_page``.
-
-            - ``"stats"``: A dictionary with aggregate statistics, including:
-
-                - ``"total"``: Total number of feedback records matching the filters.
-                - ``"up"``: Number of positive (up) ratings.
-                - ``"down"``: Number of negative (down) ratings.
-                - ``"with_comment"``: Number of feedback records that include a
-                  non-empty comment.
-    """
-    # Validate and cap per_page
-    per_page = min(max(1, per_page), 100)
-    page = max(1, page)
-
-    # Build base query with filters (to be shared by main query and stats query)
-    base_query = db.query(UserFeedback)
-
-    # Apply filters to base query
-    if target_type:
-        if target_type == "snippet":
-            base_query = base_query.filter(UserFeedback.snippet_id.isnot(None))
-        elif target_type == "page":
-            base_query = base_query.filter(UserFeedback.page_id.isnot(None))
-        elif target_type == "rewritten":
-            base_query = base_query.filter(UserFeedback.rewritten_document_id.isnot(None))
-
-    if rating:
-        if rating == "up":
-            base_query = base_query.filter(UserFeedback.rating == True)
-        elif rating == "down":
-            base_query = base_query.filter(UserFeedback.rating == False)
-
-    if has_comment:
-        if has_comment == "yes":
-            base_query = base_query.filter(
-                UserFeedback.comment.isnot(None),
-                func.length(func.trim(UserFeedback.comment)) > 0
-            )
-        elif has_comment == "no":
-            base_query = base_query.filter(
-                or_(
-                    UserFeedback.comment.is_(None),
-                    func.length(func.trim(UserFeedback.comment)) == 0
-                )
-            )
-
-    # Create main query from base query with eager loading
-    # Use nested joinedload to access page relationships for snippets and rewritten documents
-    query = base_query.options(
-        joinedload(UserFeedback.user),
-        joinedload(UserFeedback.snippet).joinedload(Snippet.page),
-        joinedload(UserFeedback.page),
-        joinedload(UserFeedback.rewritten_document).joinedload(RewrittenDocument.page)
-    )
-
-    # Apply sorting
-    if sort_by == "rating":
-        order_col = UserFeedback.rating
-    else:  # default to date
-        order_col = UserFeedback.created_at
-
-    if sort_order == "asc":
-        query = query.order_by(order_col.asc())
-    else:
-        query = query.order_by(order_col.desc())
-
-    # Get total count (before pagination)
-    total = query.count()
-    total_pages = (total + per_page - 1) // per_page if total > 0 else 1
-
-    # Apply pagination
-    offset = (page - 1) * per_page
-    feedback_items = query.offset(offset).limit(per_page).all()
-
-    # Get stats using aggregation with the same filters applied via base_query
-    # Using base_query.with_entities() ensures stats reflect the filtered subset,
-    # not all feedback items in the database
-    stats_query = base_query.with_entities(
-        func.count(UserFeedback.id).label('total'),
-        func.sum(case((UserFeedback.rating == True, 1), else_=0)).label('thumbs_up'),
-        func.sum(case((UserFeedback.rating == False, 1), else_=0)).label('thumbs_down'),
-        func.sum(case((func.coalesce(func.length(func.trim(UserFeedback.comment)), 0) > 0, 1), else_=0)).label('has_comments')
-    ).first()
-
-    stats = {
-        'total': stats_query.total or 0,
-        'thumbs_up': stats_query.thumbs_up or 0,
-        'thumbs_down': stats_query.thumbs_down or 0,
-        'has_comments': stats_query.has_comments or 0
-    }
-
-    return {
-        'items': feedback_items,
-        'pagination': {
-            'page': page,
-            'per_page': per_page,
-            'total': total,
-            'total_pages': total_pages,
-            'has_prev': page > 1,
-            'has_next': page < total_pages,
-            'start_idx': offset + 1 if total > 0 else 0,
-            'end_idx': min(offset + per_page, total)
-        },
-        'stats': stats
-    }
-
-
 @router.get("/admin/feedback")
 async def admin_feedback_page(
     request: Request,
@@ -599,6 +458,7 @@ async def admin_feedback_page(
     has_comment: Optional[str] = Query(None),
     sort_by: str = Query("date"),
     sort_order: str = Query("desc"),
+    after: Optional[str] = Query(None),
     session_token: str = Cookie(None)
 ):
     """Admin feedback viewer with filtering, sorting, and pagination."""
@@ -615,7 +475,8 @@ async def admin_feedback_page(
             rating=rating,
             has_comment=has_comment,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            after=after
         )
 
         return templates.TemplateResponse("admin_feedback.html", {
@@ -0,0 +1,288 @@
+"""
+Query helpers for the admin feedback viewer.
+
+Kept free of FastAPI/Jinja2 imports so the query logic can be unit tested
+directly against a SQLAlchemy session.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, case, event, literal, select, tuple_
+from sqlalchemy.orm import Session, selectinload, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from shared.models import User, UserFeedback, Snippet, RewrittenDocument
+from .docset_cache import DocsetCache
+
+
+def _parse_feedback_cursor(after: Optional[str], sort_by: str):
+    """
+    Parse a ``"<sort value>,<id>"`` keyset cursor for get_admin_feedback.
+
+    Returns:
+        tuple: ``(sort_value, feedback_id)``, or None if the cursor is missing
+            or malformed (callers then fall back to OFFSET pagination).
+    """
+    if not after:
+        return None
+    value, _, feedback_id = after.rpartition(',')
+    try:
+        feedback_id = int(feedback_id)
+        if sort_by == "rating":
+            return value == "1", feedback_id
+        return datetime.fromisoformat(value), feedback_id
+    except ValueError:
+        return None
+
+
+def _feedback_cursor(item, sort_by: str) -> Optional[str]:
+    """Build the keyset cursor that resumes pagination after ``item``."""
+    if sort_by == "rating":
+        return f"{int(item.rating)},{item.id}"
+    if item.created_at is None:
+        return None
+    return f"{item.created_at.isoformat()},{item.id}"
+
+
+# Feedback stats only change when feedback is written, so cache them per filter
+# combination and per version of the feedback table. The version is
+# (max id, row count, latest created_at): inserts raise the max id, deletes drop
+# the count, and re-rating existing feedback bumps its created_at, so writes from
+# any replica change the key and the next call recomputes. Superseded versions
+# age out after the TTL.
+FEEDBACK_STATS_TTL = 30
+_feedback_stats_cache = DocsetCache(default_ttl=FEEDBACK_STATS_TTL)
+
+
+def invalidate_feedback_stats_cache() -> None:
+    """Drop all cached feedback stats (e.g. to free entries after a bulk wipe)."""
+    _feedback_stats_cache.invalidate_all()
+
+
+def _feedback_stats_version(db: Session) -> str:
+    """Return a key that changes whenever feedback rows are inserted, deleted or re-rated."""
+    max_id, count, latest = db.execute(
+        select(
+            func.max(UserFeedback.id),
+            func.count(UserFeedback.id),
+            func.max(UserFeedback.created_at)
+        )
+    ).one()
+    return f"{max_id}|{count}|{latest}"
+
+
+# Feedback authors are a small, rarely changing set, so keep detached copies per
+# process instead of loading them again for every feedback page. Writes through
+# this process drop the cache and the TTL bounds staleness.
+FEEDBACK_USER_TTL = 300
+_feedback_user_cache = DocsetCache(default_ttl=FEEDBACK_USER_TTL)
+
+
+@event.listens_for(User, 'after_insert')
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_feedback_users(mapper, connection, target):
+    """Drop cached feedback authors whenever a user row is written."""
+    _feedback_user_cache.invalidate_all()
+
+
+def _attach_feedback_users(db: Session, feedback_items) -> None:
+    """
+    Populate ``UserFeedback.user`` on ``feedback_items`` from the author cache.
+
+    Authors missing from the cache are fetched in one IN (...) query. Cached
+    users are detached copies built from plain column values, and they are
+    attached with ``set_committed_value`` so the session neither flags the
+    feedback rows as dirty nor cascades the users into itself.
+    """
+    users = dict(_feedback_user_cache.get('users') or {})
+    missing = {item.user_id for item in feedback_items} - users.keys()
+    if missing:
+        rows = db.execute(select(*User.__table__.columns).where(User.id.in_(missing))).all()
+        for row in rows:
+            user = User(**row._mapping)
+            make_transient_to_detached(user)
+            users[user.id] = user
+        _feedback_user_cache.set('users', users)
+
+    for item in feedback_items:
+        set_committed_value(item, 'user', users.get(item.user_id))
+
+
+def get_admin_feedback(
+    db: Session,
+    page: int = 1,
+    per_page: int = 25,
+    target_type: Optional[str] = None,
+    rating: Optional[str] = None,
+    has_comment: Optional[str] = None,
+    sort_by: str = "date",
+    sort_order: str = "desc",
+    after: Optional[str] = None
+):
+    """
+    Query feedback with server-side pagination, filtering, and sorting.
+
+    Args:
+        db: Database session.
+        page: Page number (1-indexed).
+        per_page: Items per page (max 100).
+        target_type: Filter by target type (``"snippet"``, ``"page"``, ``"rewritten"``).
+        rating: Filter by rating (``"up"``, ``"down"``).
+        has_comment: Filter by comment presence (``"yes"``, ``"no"``).
+        sort_by: Sort field (e.g. ``"date"``, ``"rating"``).
+        sort_order: Sort direction (``"asc"``, ``"desc"``).
+        after: Optional keyset cursor (``pagination["next_cursor"]`` from the
+            previous page); when valid, the page is fetched by seeking past it
+            instead of using OFFSET.
+
+    Returns:
+        dict: A dictionary containing the feedback data and metadata with at least
+            the following keys:
+
+            - ``"items"``: A list of feedback records for the current page.
+            - ``"pagination"``: A dictionary with pagination metadata, including:
+
+                - ``"page"``: The current page number (1-indexed).
+                - ``"per_page"``: The number of items per page.
+                - ``"total_items"``: The total number of feedback records matching
+                  the current filters.
+                - ``"total_pages"``: The total number of pages available for the
+                  current filters and ``per_page``.
+                - ``"next_cursor"``: Cursor to pass as ``after`` for the next page,
+                  or None on the last page.
+
+            - ``"stats"``: A dictionary with aggregate statistics, including:
+
+                - ``"total"``: Total number of feedback records matching the filters.
+                - ``"up"``: Number of positive (up) ratings.
+                - ``"down"``: Number of negative (down) ratings.
+                - ``"with_comment"``: Number of feedback records that include a
+                  non-empty comment.
+    """
+    # Validate and cap per_page
+    per_page = min(max(1, per_page), 100)
+    page = max(1, page)
+
+    # Build filters (shared by the main statement and the stats statement)
+    filters = []
+    if target_type:
+        if target_type == "snippet":
+            filters.append(UserFeedback.snippet_id.isnot(None))
+        elif target_type == "page":
+            filters.append(UserFeedback.page_id.isnot(None))
+        elif target_type == "rewritten":
+            filters.append(UserFeedback.rewritten_document_id.isnot(None))
+
+    if rating:
+        if rating == "up":
+            filters.append(UserFeedback.rating == True)
+        elif rating == "down":
+            filters.append(UserFeedback.rating == False)
+
+    if has_comment:
+        if has_comment == "yes":
+            filters.append(UserFeedback.comment.isnot(None))
+        elif has_comment == "no":
+            filters.append(UserFeedback.comment.is_(None))
+
+    # Create main statement with eager loading (2.x select() rather than the
+    # legacy Query API, which adds a translation layer on every call)
+    # Each feedback row targets only one of snippet/page/rewritten document, so
+    # selectinload issues one IN (...) query per relationship instead of widening
+    # every page row with a 4-way LEFT OUTER JOIN of mostly-NULL columns. Users
+    # come from the author cache after the page is fetched
+    loaders = []
+    # A target_type filter guarantees the other two targets are NULL on every
+    # row, so only load the relationship that can be populated
+    if target_type not in ("page", "rewritten"):
+        loaders.append(selectinload(UserFeedback.snippet).selectinload(Snippet.page))
+    if target_type not in ("snippet", "rewritten"):
+        loaders.append(selectinload(UserFeedback.page))
+    if target_type not in ("snippet", "page"):
+        loaders.append(selectinload(UserFeedback.rewritten_document).selectinload(RewrittenDocument.page))
+    stmt = select(UserFeedback).where(*filters).options(*loaders)
+
+    # Apply sorting; id breaks ties so page boundaries are stable and a page
+    # can be resumed from a (sort value, id) keyset cursor
+    if sort_by == "rating":
+        order_col = UserFeedback.rating
+    else:  # default to date
+        order_col = UserFeedback.created_at
+
+    if sort_order == "asc":
+        order_cols = [order_col.asc(), UserFeedback.id.asc()]
+    else:
+        order_cols = [order_col.desc(), UserFeedback.id.desc()]
+    # Matches the (created_at, id) / (rating, id) indexes, so the database can
+    # walk the index in order and stop after per_page rows instead of sorting
+    stmt = stmt.order_by(*order_cols)
+
+    # Get stats using aggregation with the same filters as the main statement.
+    # Stats cover the filtered subset, so their total doubles as the pagination
+    # count and replaces a separate query.count() over the same filters. The
+    # cache key includes the table version, so a cached total is never stale
+    stats_key = f"{target_type}|{rating}|{has_comment}|{_feedback_stats_version(db)}"
+    stats = _feedback_stats_cache.get(stats_key)
+    if stats is None:
+        stats_query = db.execute(
+            select(
+                func.count(UserFeedback.id).label('total'),
+                func.sum(case((UserFeedback.rating == True, 1), else_=0)).label('thumbs_up'),
+                func.sum(case((UserFeedback.rating == False, 1), else_=0)).label('thumbs_down'),
+                func.sum(case((UserFeedback.comment.isnot(None), 1), else_=0)).label('has_comments')
+            ).where(*filters)
+        ).one()
+
+        stats = {
+            'total': stats_query.total or 0,
+            'thumbs_up': stats_query.thumbs_up or 0,
+            'thumbs_down': stats_query.thumbs_down or 0,
+            'has_comments': stats_query.has_comments or 0
+        }
+        _feedback_stats_cache.set(stats_key, stats)
+
+    # Pagination bounds, each computed once; the page has a successor exactly
+    # when it ends before the last matching row
+    total = stats['total']
+    total_pages = max(1, -(-total // per_page))
+    offset = (page - 1) * per_page
+    end_idx = min(offset + per_page, total)
+    has_next = end_idx < total
+
+    # Apply pagination (nothing to fetch when the page is past the last row).
+    # With a cursor the page starts with an index seek instead of reading and
+    # discarding ``offset`` rows; without one, fall back to OFFSET
+    cursor = _parse_feedback_cursor(after, sort_by)
+    if offset >= total:
+        feedback_items = []
+    elif cursor is not None:
+        seek_key = tuple_(order_col, UserFeedback.id)
+        seek_value = tuple_(literal(cursor[0], order_col.type), literal(cursor[1]))
+        if sort_order == "asc":
+            stmt = stmt.where(seek_key > seek_value)
+        else:
+            stmt = stmt.where(seek_key < seek_value)
+        feedback_items = db.execute(stmt.limit(per_page)).scalars().all()
+    else:
+        feedback_items = db.execute(stmt.offset(offset).limit(per_page)).scalars().all()
+
+    _attach_feedback_users(db, feedback_items)
+
+    next_cursor = _feedback_cursor(feedback_items[-1], sort_by) if has_next and feedback_items else None
+
+    return {
+        'items': feedback_items,
+        'pagination': {
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'total_pages': total_pages,
+            'has_prev': page > 1,
+            'has_next': has_next,
+            'next_cursor': next_cursor,
+            'start_idx': offset + 1 if total > 0 else 0,
+            'end_idx': end_idx
+        },
+        'stats': stats
+    }
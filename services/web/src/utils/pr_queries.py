@@ -48,9 +48,11 @@ def get_user_pull_requests(
     if doc_set:
         query = query.filter(PullRequest.doc_set == doc_set)
 
-    query = query.order_by(desc(PullRequest.created_at))
+    # Count the filtered primary keys directly; query.count() would wrap the
+    # ordered query in a subquery and sort every matching row just to count it
+    total_count = query.with_entities(func.count(PullRequest.id)).scalar()
 
-    total_count = query.count()
+    query = query.order_by(desc(PullRequest.created_at))
     pull_requests = query.offset(offset).limit(limit).all()
 
     return _format_pull_requests(pull_requests), total_count
@@ -89,9 +91,11 @@ def get_all_pull_requests(
     if doc_set:
         query = query.filter(PullRequest.doc_set == doc_set)
 
-    query = query.order_by(desc(PullRequest.created_at))
+    # Count the filtered primary keys directly; query.count() would wrap the
+    # ordered query in a subquery and sort every matching row just to count it
+    total_count = query.with_entities(func.count(PullRequest.id)).scalar()
 
-    total_count = query.count()
+    query = query.order_by(desc(PullRequest.created_at))
     pull_requests = query.offset(offset).limit(limit).all()
 
     return _format_pull_requests(pull_requests, include_user=True, db=db), total_count
@@ -294,6 +298,17 @@ def _format_pull_requests(
     """
     result = []
 
+    # Load every author on the page in one IN (...) query rather than one
+    # query per row
+    users = {}
+    if include_user and db:
+        user_ids = {pr.user_id for pr in pull_requests if pr.user_id}
+        if user_ids:
+            users = {
+                user.id: user
+                for user in db.query(User).filter(User.id.in_(user_ids)).all()
+            }
+
     for pr in pull_requests:
         formatted = {
             'id': pr.id,
@@ -319,7 +334,7 @@ def _format_pull_requests(
         }
 
         if include_user and db:
-            user = db.query(User).filter(User.id == pr.user_id).first() if pr.user_id else None
+            user = users.get(pr.user_id) if pr.user_id else None
             formatted['user'] = {
                 'id': user.id,
                 'username': user.github_username,
@@ -44,13 +44,18 @@ class BaselineInfo:
 class GitHubDiscoveryService:
     """Optimized file discovery using GitHub APIs exclusively"""
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Optional[Session] = None):
         self.db = db_session
         self.github_service = GitHubService()
         self.queue_service = QueueService(queue_name='changed_files')
         self.baseline_manager = BaselineManager(db_session)
         self.logger = get_logger(__name__)
         self.metrics = get_metrics()
+
+    def bind_session(self, db_session: Optional[Session]):
+        """Switch the database session used for discovery and baseline lookups"""
+        self.db = db_session
+        self.baseline_manager.db = db_session
         
     def discover_changes(self, repo_url: str, scan_id: int, force_full_scan: bool = False) -> int:
         """
@@ -8,7 +8,7 @@ import os
 import time
 import signal
 import threading
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add the project root to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
@@ -82,11 +82,16 @@ class LLMScoringWorker:
                 self.logger.warning(f"Page {page_id} not found, may have been deleted")
                 return True  # Page deleted, skip
 
-            # Call the LLM for holistic scoring (this is the slow part, ~60 sec)
-            self.logger.info(f"[LLM] Calling MCP server for page {page_id}")
-            mcp_result = self.scoring_service.apply_mcp_holistic_scoring(
-                page_content, page_url
-            )
+            # Reuse an earlier LLM result if this exact content was already scored
+            mcp_result = self._find_previous_holistic_result(db_session, page)
+            if mcp_result:
+                self.logger.info(f"[LLM] Reusing holistic score for unchanged content of page {page_id}")
+            else:
+                # Call the LLM for holistic scoring (this is the slow part, ~60 sec)
+                self.logger.info(f"[LLM] Calling MCP server for page {page_id}")
+                mcp_result = self.scoring_service.apply_mcp_holistic_scoring(
+                    page_content, page_url
+                )
 
             if mcp_result:
                 mcp_result['review_method'] = 'llm'
@@ -129,6 +134,38 @@ class LLMScoringWorker:
         finally:
             db_session.close()
 
+    def _find_previous_holistic_result(self, db_session, page: Page) -> Optional[Dict[str, Any]]:
+        """
+        Look up a completed LLM holistic result for the same URL and content hash.
+
+        Re-scans of unchanged files would otherwise send the whole page to the
+        MCP server again; the (url, content_hash) index makes this lookup cheap.
+
+        Returns:
+            A copy of the earlier result, or None if no scored duplicate exists
+        """
+        if not page.content_hash:
+            return None
+
+        try:
+            candidates = db_session.query(Page.mcp_holistic).filter(
+                Page.url == page.url,
+                Page.content_hash == page.content_hash,
+                Page.id != page.id,
+                Page.mcp_holistic.isnot(None)
+            ).order_by(Page.id.desc()).limit(5).all()
+        except Exception as e:
+            self.logger.warning(f"Could not look up previous holistic result for page {page.id}: {e}")
+            # A failed SELECT aborts the transaction on PostgreSQL; roll back so
+            # the result of the MCP call that follows can still be committed
+            db_session.rollback()
+            return None
+
+        for (mcp_holistic,) in candidates:
+            if isinstance(mcp_holistic, dict) and mcp_holistic.get('review_method') == 'llm':
+                return dict(mcp_holistic)
+        return None
+
     def start_consuming(self):
         """Start consuming LLM scoring tasks from the queue"""
         self.logger.info("LLM scoring worker starting...")
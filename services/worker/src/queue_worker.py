@@ -5,6 +5,7 @@ This replaces the monolithic crawler/queue_worker.py
 import sys
 import os
 import time
+import random
 import signal
 import threading
 
@@ -27,6 +28,8 @@ class RefactoredQueueWorker:
     
     def __init__(self):
         self.queue_service = QueueService()
+        # One orchestrator per worker; each task binds its own short-lived session
+        self.orchestrator = ScanOrchestrator()
         self.logger = get_logger(__name__)
         self.shutdown_event = threading.Event()
         self.setup_signal_handlers()
@@ -58,8 +61,8 @@ class RefactoredQueueWorker:
         db_session = SessionLocal()
         
         try:
-            # Create orchestrator with database session
-            orchestrator = ScanOrchestrator(db_session)
+            orchestrator = self.orchestrator
+            orchestrator.bind_session(db_session)
             
             # Check if scan was cancelled before processing
             if orchestrator._check_cancellation(scan_id):
@@ -78,6 +81,7 @@ class RefactoredQueueWorker:
             self.logger.error(f"Unexpected error processing task: {e}", exc_info=True)
             
         finally:
+            self.orchestrator.bind_session(None)
             db_session.close()
 
     def start_consuming(self):
@@ -87,8 +91,11 @@ class RefactoredQueueWorker:
         retry_count = 0
         max_retries = 3
         base_delay = 5  # seconds
+        max_delay = 60  # seconds
+        stable_period = 300  # seconds of healthy consumption before retries reset
         
         while retry_count < max_retries and not self.shutdown_event.is_set():
+            consumption_start = time.monotonic()
             try:
                 self.logger.info(f"Starting to consume tasks (attempt {retry_count + 1}/{max_retries})...")
                 # The queue service now handles its own connection retries
@@ -98,16 +105,17 @@ class RefactoredQueueWorker:
                 break
                 
             except Exception as e:
+                # A long healthy run means this is a fresh outage, not a repeat failure
+                if time.monotonic() - consumption_start > stable_period:
+                    retry_count = 0
                 retry_count += 1
                 self.logger.error(f"Error during task consumption (attempt {retry_count}/{max_retries}): {e}", exc_info=True)
                 
                 if retry_count < max_retries and not self.shutdown_event.is_set():
-                    delay = base_delay * (2 ** (retry_count - 1))  # Exponential backoff
-                    self.logger.info(f"Retrying in {delay} seconds...")
-                    for _ in range(delay):
-                        if self.shutdown_event.is_set():
-                            break
-                        time.sleep(1)
+                    # Capped exponential backoff with full jitter so restarting workers don't reconnect in lockstep
+                    delay = random.uniform(0, min(max_delay, base_delay * (2 ** (retry_count - 1))))
+                    self.logger.info(f"Retrying in {delay:.1f} seconds...")
+                    self.shutdown_event.wait(delay)
                 else:
                     self.logger.error("Max retries reached or shutdown requested. Queue worker shutting down.")
                     
@@ -22,7 +22,7 @@ from packages.extractor.parser import extract_code_snippets
 class ScanOrchestrator:
     """Orchestrates the complete scan workflow for GitHub scans"""
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Optional[Session] = None):
         self.db = db_session
         self.scoring_service = ScoringService()
         self.doc_queue_service = QueueService(queue_name='doc_processing')
@@ -30,6 +30,16 @@ class ScanOrchestrator:
         # Note: Using progress_tracker directly instead of progress_service to avoid FastAPI dependency
         self.metrics = get_metrics()
 
+    def bind_session(self, db_session: Optional[Session]):
+        """
+        Point this orchestrator (and its discovery service) at a new database session.
+
+        Lets a long-lived orchestrator reuse its service clients across tasks
+        while each task runs in its own short-lived session.
+        """
+        self.db = db_session
+        self.discovery_service.bind_session(db_session)
+
     def _check_cancellation(self, scan_id: int) -> bool:
         """
         Check if scan has been cancelled
@@ -246,19 +256,27 @@ class ScanOrchestrator:
         processed_count = 0
         total_pages = len(page_objs)
         
-        for page_url, page_obj in page_objs.items():
+        # Pages without content are counted as processed without a request
+        pages_to_score = []
+        for page_url in page_objs:
             html = crawled_results.get(page_url)
             if html:
-                mcp_result = self.scoring_service.apply_mcp_holistic_scoring(html, page_url)
-                if mcp_result and page_obj:
-                    page_obj.mcp_holistic = mcp_result
-                    self.db.commit()
-                    
-                    # Check if bias was detected and report result
-                    if mcp_result.get('bias_types'):
-                        progress_tracker.report_page_result(
-                            self.db, scan_id, page_url, True, mcp_result
-                        )
+                pages_to_score.append((html, page_url))
+            else:
+                processed_count += 1
+        
+        # MCP requests run concurrently; results are written here on the session's thread
+        for page_url, mcp_result in self.scoring_service.iter_mcp_holistic_scoring(pages_to_score):
+            page_obj = page_objs.get(page_url)
+            if mcp_result and page_obj:
+                page_obj.mcp_holistic = mcp_result
+                self.db.commit()
+                
+                # Check if bias was detected and report result
+                if mcp_result.get('bias_types'):
+                    progress_tracker.report_page_result(
+                        self.db, scan_id, page_url, True, mcp_result
+                    )
             
             processed_count += 1
             # Report progress
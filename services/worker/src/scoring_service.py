@@ -2,12 +2,15 @@
 ScoringService - Handles bias detection and scoring functionality
 Extracted from the monolithic queue_worker.py
 """
+import asyncio
 import os
-from typing import Dict, List, Optional, Any, Iterator
-from packages.scorer.heuristics import is_windows_biased
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Iterator, Coroutine, Tuple
+from packages.scorer.heuristics import is_windows_biased, bulk_is_windows_biased
 from packages.scorer.llm_client import LLMClient
 from shared.config import config
-from shared.utils.http_client import post_json
+from shared.utils.http_client import parse_json, post_json, post_json_async
+from shared.utils.logging import get_logger
 from shared.utils.metrics import get_metrics
 
 
@@ -17,10 +20,24 @@ def chunk_list(items: List[Any], size: int) -> Iterator[List[Any]]:
         yield items[i:i + size]
 
 
+def run_eager(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion on a fresh event loop.
+
+    Uses asyncio's eager task factory where available (Python 3.12+) so tasks
+    that can finish without blocking skip the scheduler round trip.
+    """
+    with asyncio.Runner() as runner:
+        if hasattr(asyncio, 'eager_task_factory'):
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+        return runner.run(coro)
+
+
 class ScoringService:
     """Service responsible for bias detection and scoring operations"""
     
     def __init__(self, mcp_server_url: Optional[str] = None):
+        self.logger = get_logger(__name__)
         self.llm_client = LLMClient()
         base_url = mcp_server_url or os.getenv("MCP_SERVER_URL", "http://localhost:9000/score_page")
         # Extract base URL without endpoint path
@@ -33,6 +50,8 @@ class ScoringService:
         self.metrics = get_metrics()
         # Use centralized config for batch size
         self.batch_size = config.azure_openai.llm_batch_size
+        self.batch_concurrency = config.azure_openai.llm_batch_concurrency
+        self.holistic_concurrency = config.azure_openai.mcp_holistic_concurrency
 
     def apply_heuristic_scoring(self, snippets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -44,15 +63,13 @@ class ScoringService:
         Returns:
             List of snippets that were flagged by heuristics
         """
-        flagged = []
+        flagged_indices = bulk_is_windows_biased(snippets)
+        flagged = [snippet for idx, snippet in enumerate(snippets) if idx in flagged_indices]
 
-        for snippet in snippets:
-            if is_windows_biased(snippet):
-                flagged.append(snippet)
-                # Record heuristic bias detection
-                self.metrics.record_bias_detected('heuristic', 'windows')
+        # Record heuristic bias detection with one counter update per batch
+        self.metrics.record_bias_detected('heuristic', 'windows', count=len(flagged))
 
-        print(f"[INFO] {len(flagged)} snippets flagged by heuristics.")
+        self.logger.info("%d snippets flagged by heuristics.", len(flagged))
         return flagged
 
     def _create_heuristic_score(self, snippet: Dict[str, Any]) -> Dict[str, Any]:
@@ -100,7 +117,7 @@ class ScoringService:
         if not snippets:
             return snippets
 
-        print(f"[INFO] Scoring {len(snippets)} snippets with LLM (batch size: {self.batch_size})...")
+        self.logger.info("Scoring %d snippets with LLM (batch size: %d)...", len(snippets), self.batch_size)
 
         # Use batch scoring if batch_size > 1 and we have the MCP server URL
         if self.batch_size > 1:
@@ -113,64 +130,95 @@ class ScoringService:
         """
         Score snippets in batches using the /score_snippets endpoint.
         """
-        total_batches = (len(snippets) + self.batch_size - 1) // self.batch_size
-        batch_num = 0
-
-        for batch in chunk_list(snippets, self.batch_size):
-            batch_num += 1
-            print(f"[LLM] Scoring batch {batch_num}/{total_batches} ({len(batch)} snippets)")
-
-            # Prepare batch payload with snippet IDs
-            batch_payload = []
-            snippet_id_map = {}
-
-            for idx, snippet in enumerate(batch):
-                # Use index as ID if snippet doesn't have one
-                snippet_id = snippet.get('id', idx)
-                snippet_id_map[snippet_id] = snippet
-
-                batch_payload.append({
-                    "id": snippet_id,
-                    "code": snippet.get('code', ''),
-                    "language": snippet.get('language', ''),
-                    "context": snippet.get('context', '')
-                })
-
-            try:
+        return run_eager(self.apply_llm_scoring_async(snippets))
+
+    async def apply_llm_scoring_async(self, snippets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Score snippets in batches, dispatching up to ``batch_concurrency``
+        /score_snippets requests at a time.
+
+        Args:
+            snippets: List of snippet dictionaries
+
+        Returns:
+            List of snippets with LLM scores added
+        """
+        batches = list(chunk_list(snippets, self.batch_size))
+        semaphore = asyncio.Semaphore(max(1, self.batch_concurrency))
+
+        await asyncio.gather(*(
+            self._score_batch_async(batch, batch_num, len(batches), semaphore)
+            for batch_num, batch in enumerate(batches, start=1)
+        ))
+        return snippets
+
+    async def _score_batch_async(
+        self,
+        batch: List[Dict[str, Any]],
+        batch_num: int,
+        total_batches: int,
+        semaphore: asyncio.Semaphore
+    ):
+        """Score a single batch, falling back to heuristics on failure."""
+        self.logger.debug("[LLM] Scoring batch %d/%d (%d snippets)", batch_num, total_batches, len(batch))
+
+        # Prepare batch payload with snippet IDs
+        batch_payload = []
+        snippet_id_map = {}
+
+        for idx, snippet in enumerate(batch):
+            # Use index as ID if snippet doesn't have one
+            snippet_id = snippet.get('id', idx)
+            snippet_id_map[snippet_id] = snippet
+
+            batch_payload.append({
+                "id": snippet_id,
+                "code": snippet.get('code', ''),
+                "language": snippet.get('language', ''),
+                "context": snippet.get('context', '')
+            })
+
+        try:
+            async with semaphore:
                 # Use metrics context manager to track API call
                 with self.metrics.time_api_request('mcp_server_batch', 'POST'):
-                    response = post_json(
+                    response = await post_json_async(
                         self.mcp_snippets_url,
                         {"snippets": batch_payload},
-                        timeout=120  # Longer timeout for batch requests
+                        timeout=120,  # Longer timeout for batch requests
+                        compress=True
                     )
 
-                if response.status_code == 200:
-                    results = response.json().get("results", [])
-
-                    # Map results back to snippets
-                    for result in results:
-                        snippet_id = result.get("id")
-                        if snippet_id in snippet_id_map:
-                            snippet_id_map[snippet_id]['llm_score'] = result
-                else:
-                    print(f"[WARN] Batch scoring failed with status {response.status_code}, falling back to heuristic scoring")
-                    for snippet in batch:
-                        snippet['llm_score'] = self._create_heuristic_score(snippet)
-
-            except Exception as e:
-                print(f"[WARN] Batch scoring error: {e}, falling back to heuristic scoring")
+            if response.status_code == 200:
+                results = parse_json(response).get("results", [])
+
+                # Map results back to snippets
+                for result in results:
+                    snippet_id = result.get("id")
+                    if snippet_id in snippet_id_map:
+                        snippet_id_map[snippet_id]['llm_score'] = result
+            else:
+                self.logger.warning(
+                    "Batch scoring failed with status %s, falling back to heuristic scoring",
+                    response.status_code
+                )
                 for snippet in batch:
                     snippet['llm_score'] = self._create_heuristic_score(snippet)
 
-        return snippets
+        except Exception as e:
+            self.logger.warning("Batch scoring error: %s, falling back to heuristic scoring", e)
+            for snippet in batch:
+                snippet['llm_score'] = self._create_heuristic_score(snippet)
 
     def _apply_individual_scoring(self, snippets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Score snippets individually using the LLM client (fallback method).
         """
+        total = len(snippets)
         for i, snippet in enumerate(snippets):
-            print(f"[LLM] Scoring snippet {i+1}/{len(snippets)} from {snippet.get('url', 'unknown')}")
+            # Log progress periodically rather than once per snippet
+            if i % 100 == 0:
+                self.logger.info("[LLM] Scoring snippet %d/%d from %s", i + 1, total, snippet.get('url', 'unknown'))
             snippet['llm_score'] = self.llm_client.score_snippet(snippet)
 
         return snippets
@@ -187,7 +235,7 @@ class ScoringService:
             MCP scoring result or None if error
         """
         try:
-            print(f"[MCP] Sending page to MCP server: {page_url}")
+            self.logger.debug("[MCP] Sending page to MCP server: %s", page_url)
             
             # Use metrics context manager to track API call
             with self.metrics.time_api_request('mcp_server', 'POST'):
@@ -197,23 +245,87 @@ class ScoringService:
                         "page_content": page_content,
                         "metadata": {"url": page_url}
                     },
-                    timeout=60
+                    timeout=60,
+                    compress=True
                 )
             
-            print(f"[MCP] MCP server response status: {response.status_code}")
+            self.logger.debug("[MCP] MCP server response status: %s", response.status_code)
             
             if response.status_code == 200:
-                mcp_result = response.json()
-                print(f"[MCP] Holistic score for {page_url}: {mcp_result}")
+                mcp_result = parse_json(response)
+                self.logger.debug("[MCP] Holistic score for %s: %s", page_url, mcp_result)
                 return mcp_result
             else:
-                print(f"[MCP] Error from MCP server for {page_url}: {response.status_code} {response.text}")
+                self.logger.error("[MCP] Error from MCP server for %s: %s %s", page_url, response.status_code, response.text)
                 return None
                 
         except Exception as e:
-            print(f"[MCP] Exception contacting MCP server for {page_url}: {e}")
+            self.logger.error("[MCP] Exception contacting MCP server for %s: %s", page_url, e)
             return None
 
+    def iter_mcp_holistic_scoring(
+        self, pages: List[Tuple[str, str]]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Apply MCP holistic scoring to several pages concurrently
+
+        Each page is an independent blocking POST, so requests are fanned out
+        to a thread pool and results are yielded as they complete. Callers
+        consume results on their own thread, so database sessions are safe
+        to use while iterating.
+
+        Args:
+            pages: List of (page_content, page_url) tuples
+
+        Yields:
+            (page_url, MCP scoring result or None if error) in completion order
+        """
+        if not pages:
+            return
+
+        max_workers = max(1, min(self.holistic_concurrency, len(pages)))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(self._score_page_in_flight, page_content, page_url): page_url
+                for page_content, page_url in pages
+            }
+            for future in as_completed(futures):
+                # apply_mcp_holistic_scoring handles its own errors and returns None
+                yield futures[future], future.result()
+        finally:
+            # If the caller stops early (e.g. its DB commit raised), drop the
+            # queued requests instead of waiting for every LLM call to run;
+            # requests already in flight finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _score_page_in_flight(self, page_content: str, page_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Run apply_mcp_holistic_scoring on a pool thread, counted in the active gauge
+
+        The gauge is adjusted relative to its current value, so concurrent
+        iterators share it and queued or cancelled requests are never counted.
+        """
+        self.metrics.record_mcp_request_started()
+        try:
+            return self.apply_mcp_holistic_scoring(page_content, page_url)
+        finally:
+            self.metrics.record_mcp_request_finished()
+
+    def apply_mcp_holistic_scoring_batch(
+        self, pages: List[Tuple[str, str]]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Apply MCP holistic scoring to several pages concurrently
+
+        Args:
+            pages: List of (page_content, page_url) tuples
+
+        Returns:
+            Dictionary mapping page URL to MCP scoring result (None if error)
+        """
+        return dict(self.iter_mcp_holistic_scoring(pages))
+
     def get_bias_metrics(self, snippets: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         Calculate bias metrics from scored snippets
@@ -224,17 +336,20 @@ class ScoringService:
         Returns:
             Dictionary with bias metrics
         """
-        biased_snippets = [
-            s for s in snippets 
-            if s.get('llm_score', {}).get('windows_biased')
-        ]
-        
-        # Get unique URLs that contain biased snippets
-        biased_urls = set(s.get('url') for s in biased_snippets if s.get('url'))
+        # Single pass: count biased snippets and collect the unique URLs that contain them
+        biased_urls = set()
+        flagged = 0
+        for snippet in snippets:
+            score = snippet.get('llm_score')
+            if score is not None and score.get('windows_biased'):
+                flagged += 1
+                url = snippet.get('url')
+                if url:
+                    biased_urls.add(url)
         
         return {
             'biased_pages_count': len(biased_urls),
-            'flagged_snippets_count': len(biased_snippets)
+            'flagged_snippets_count': flagged
         }
 
     def score_snippet_batch(
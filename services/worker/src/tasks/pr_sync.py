@@ -32,6 +32,12 @@ logger = get_logger(__name__)
 GITHUB_API_BASE = "https://api.github.com"
 RATE_LIMIT_BUFFER = 10  # Stop when we have this many requests remaining
 
+# Compare URL path: /owner/repo/compare/base...head_user:head_repo:head_branch
+_COMPARE_URL_RE = re.compile(
+    r'github\.com/([^/]+)/([^/]+)/compare/([^.]+)\.\.\.([^:]+):([^:]+):(.+)$'
+)
+_PR_URL_RE = re.compile(r'github\.com/([^/]+)/([^/]+)/pull/(\d+)')
+
 
 class PRSyncService:
     """Service for synchronizing PR records with GitHub API"""
@@ -103,13 +109,9 @@ class PRSyncService:
 
         try:
             # Remove query params
-            url_path = compare_url.split('?')[0]
+            url_path = compare_url.partition('?')[0]
 
-            # Match pattern: /owner/repo/compare/base...head_user:head_repo:head_branch
-            match = re.search(
-                r'github\.com/([^/]+)/([^/]+)/compare/([^.]+)\.\.\.([^:]+):([^:]+):(.+)$',
-                url_path
-            )
+            match = _COMPARE_URL_RE.search(url_path)
 
             if match:
                 result['owner'] = match.group(1)
@@ -282,7 +284,7 @@ class PRSyncService:
                 continue
 
             # Parse owner/repo from pr_url
-            match = re.search(r'github\.com/([^/]+)/([^/]+)/pull/(\d+)', pr.pr_url)
+            match = _PR_URL_RE.search(pr.pr_url)
             if not match:
                 pr.last_synced_at = datetime.utcnow()
                 continue
@@ -129,6 +129,8 @@ class AzureOpenAIConfig:
     client_id: Optional[str] = None  # For managed identity authentication
     requests_per_minute: int = 60  # Rate limit for API requests
     llm_batch_size: int = 5  # Number of snippets to score per LLM request (1 = no batching)
+    llm_batch_concurrency: int = 4  # Number of batch scoring requests in flight at once
+    mcp_holistic_concurrency: int = 8  # Number of page holistic scoring requests in flight at once
 
     @classmethod
     def from_env(cls) -> 'AzureOpenAIConfig':
@@ -139,7 +141,9 @@ class AzureOpenAIConfig:
             api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2023-05-15"),
             client_id=os.getenv("AZURE_OPENAI_CLIENTID"),
             requests_per_minute=int(os.getenv("AZURE_OPENAI_RPM", "60")),
-            llm_batch_size=int(os.getenv("LLM_BATCH_SIZE", "5"))
+            llm_batch_size=int(os.getenv("LLM_BATCH_SIZE", "5")),
+            llm_batch_concurrency=int(os.getenv("LLM_BATCH_CONCURRENCY", "4")),
+            mcp_holistic_concurrency=int(os.getenv("MCP_HOLISTIC_CONCURRENCY", "8"))
         )
     
     @property
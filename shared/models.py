@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, DateTime, JSON, Date, Float
 import sqlalchemy as sa
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 import datetime
 
 Base = declarative_base()
@@ -207,6 +207,11 @@ class UserFeedback(Base):
     page = relationship("Page", back_populates="feedback")
     rewritten_document = relationship("RewrittenDocument", back_populates="feedback")
 
+    @validates('comment')
+    def _normalize_comment(self, key, comment):
+        """Store blank or whitespace-only comments as NULL so 'has a comment' is a plain NULL check."""
+        return (comment or '').strip() or None
+
     # Constraints - now supports three types of feedback targets
     __table_args__ = (
         sa.CheckConstraint(
@@ -217,6 +222,18 @@ class UserFeedback(Base):
             """,
             name='check_feedback_target'
         ),
+        sa.CheckConstraint(
+            "comment IS NULL OR length(trim(comment)) > 0",
+            name='check_feedback_comment_not_blank'
+        ),
+        # Sort/seek indexes and target filter used by the admin feedback listing
+        sa.Index('idx_user_feedback_created_id', 'created_at', 'id'),
+        sa.Index('idx_user_feedback_rating_id', 'rating', 'id'),
+        sa.Index(
+            'idx_user_feedback_rewritten_document_id', 'rewritten_document_id',
+            postgresql_where=sa.text('rewritten_document_id IS NOT NULL'),
+            sqlite_where=sa.text('rewritten_document_id IS NOT NULL'),
+        ),
     )
 
 
@@ -23,9 +23,32 @@ engine = create_engine(
     pool_timeout=30,        # Seconds to wait before giving up on getting a connection
     pool_recycle=1800,      # Recycle connections after 30 minutes (avoid stale connections)
     pool_pre_ping=True,     # Test connections before using them (handles disconnects)
+    query_cache_size=1200,  # Compiled SQL cache; room for every filter/sort variant of the list queries
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# PRAGMAs for file-backed SQLite (local development); production runs on PostgreSQL.
+# WAL lets readers proceed during writes and NORMAL sync avoids an fsync per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",     # 64 MB page cache
+    "PRAGMA mmap_size=268435456",   # 256 MB memory-mapped I/O
+)
+
+
+if engine.dialect.name == "sqlite" and engine.url.database not in (None, "", ":memory:"):
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply SQLite tuning PRAGMAs to each new DBAPI connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 
 # Slow query detection using SQLAlchemy event listeners
 @event.listens_for(engine, "before_cursor_execute")
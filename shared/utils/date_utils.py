@@ -3,7 +3,13 @@ Date utility functions for the Linux-first Azure Docs Enforcer
 """
 import re
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
+
+# ms.date in YAML frontmatter, with any spacing and optional quotes:
+# ms.date: 01/01/2024
+# ms.date: "01/01/2024"
+# ms.date:'01/01/2024'
+_MS_DATE_RE = re.compile(r'(ms\.date\s*:\s*)(["\']?)(\d{1,2}/\d{1,2}/\d{4})(["\']?)')
 
 
 def get_current_date_mmddyyyy() -> str:
@@ -13,7 +19,66 @@ def get_current_date_mmddyyyy() -> str:
     Returns:
         str: Current date formatted as MM/DD/YYYY
     """
-    return datetime.now().strftime("%m/%d/%Y")
+    # Formatted directly rather than through strftime's locale-aware C path
+    now = datetime.now()
+    return f"{now.month:02d}/{now.day:02d}/{now.year:04d}"
+
+
+def _frontmatter_span(content: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate the body of the YAML frontmatter at the start of the document.
+    
+    The opening line is ``---``, optionally preceded by a UTF-8 byte order
+    mark and leading whitespace and followed by trailing spaces. The body ends
+    where the next line starting with ``---`` begins. Found with plain string
+    searches, so the cost is bounded by the frontmatter rather than the whole
+    document.
+    
+    Returns:
+        tuple: ``(start, end)`` offsets of the frontmatter body, or None if the
+            document has no frontmatter.
+    """
+    if not content:
+        return None
+    # Files saved by some Windows editors start with a BOM, which is not
+    # whitespace to str.lstrip
+    stripped = content[1:].lstrip() if content[0] == '\ufeff' else content.lstrip()
+    if not stripped.startswith('---'):
+        return None
+    
+    fence_end = len(content) - len(stripped) + 3
+    start = content.find('\n', fence_end) + 1
+    if not start:
+        return None
+    rest = content[fence_end:start - 1]
+    if rest.endswith('\r'):
+        rest = rest[:-1]
+    if rest.strip(' \t'):
+        return None
+    
+    # start - 1 is the opening line's newline, so an empty body is found too
+    end = content.find('\n---', start - 1) + 1
+    if not end:
+        return None
+    return start, end
+
+
+def _find_ms_date(content: str):
+    """
+    Locate the frontmatter body and the ms.date field inside it.
+    
+    Returns:
+        tuple: ``(frontmatter_span, ms_date_match)``; either may be None.
+    """
+    frontmatter = _frontmatter_span(content)
+    if not frontmatter:
+        return None, None
+    
+    start, end = frontmatter
+    key_pos = content.find('ms.date', start, end)
+    if key_pos == -1:
+        return frontmatter, None
+    return frontmatter, _MS_DATE_RE.search(content, key_pos, end)
 
 
 def update_ms_date_in_content(content: str, new_date: Optional[str] = None) -> str:
@@ -30,33 +95,18 @@ def update_ms_date_in_content(content: str, new_date: Optional[str] = None) -> s
     if new_date is None:
         new_date = get_current_date_mmddyyyy()
     
-    # Pattern to match ms.date in YAML frontmatter
-    # Handles various spacing and quote patterns:
-    # ms.date: 01/01/2024
-    # ms.date: "01/01/2024" 
-    # ms.date:'01/01/2024'
-    pattern = r'(ms\.date\s*:\s*)(["\']?)(\d{1,2}/\d{1,2}/\d{4})(["\']?)'
-    
-    def replace_date(match):
-        prefix = match.group(1)  # "ms.date: "
-        quote_open = match.group(2)  # Opening quote if present
-        quote_close = match.group(4)  # Closing quote if present
-        return f"{prefix}{quote_open}{new_date}{quote_close}"
+    frontmatter, match = _find_ms_date(content)
+    if not frontmatter:
+        # Without YAML frontmatter there is no ms.date field to update
+        return content
     
-    updated_content = re.sub(pattern, replace_date, content)
-    
-    # If no ms.date field was found, and we have YAML frontmatter, add it
-    if updated_content == content and content.strip().startswith('---'):
-        # Find the end of the frontmatter
-        frontmatter_end = content.find('---', 3)
-        if frontmatter_end != -1:
-            # Insert ms.date before the closing ---
-            insertion_point = frontmatter_end
-            # Add ms.date line with proper formatting
-            ms_date_line = f"ms.date: {new_date}\n"
-            updated_content = content[:insertion_point] + ms_date_line + content[insertion_point:]
+    if match:
+        # Swap only the date itself so spacing and quotes are preserved
+        return content[:match.start(3)] + new_date + content[match.end(3):]
     
-    return updated_content
+    # No ms.date field yet: insert one before the closing ---
+    end = frontmatter[1]
+    return content[:end] + f"ms.date: {new_date}\n" + content[end:]
 
 
 def extract_ms_date_from_content(content: str) -> Optional[str]:
@@ -69,8 +119,7 @@ def extract_ms_date_from_content(content: str) -> Optional[str]:
     Returns:
         Optional[str]: The ms.date value if found, None otherwise
     """
-    pattern = r'ms\.date\s*:\s*(["\']?)(\d{1,2}/\d{1,2}/\d{4})(["\']?)'
-    match = re.search(pattern, content)
+    _, match = _find_ms_date(content)
     if match:
-        return match.group(2)
+        return match.group(3)
     return None
\ No newline at end of file
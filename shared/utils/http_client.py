@@ -2,11 +2,18 @@
 Shared HTTP client utilities for consistent HTTP operations across the codebase
 Standardizes on httpx for both sync and async operations
 """
+import gzip
+import json
 import httpx
 import asyncio
 from typing import Dict, Any, Optional, Union
 from shared.config import config
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder/decoder
+    orjson = None
+
 
 class HTTPClient:
     """Synchronous HTTP client with consistent configuration"""
@@ -139,11 +146,42 @@ async def make_async_request(
         return await getattr(client, method.lower())(url, **kwargs)
 
 
+def _encode_json_body(data: Dict[str, Any], headers: Dict[str, str], compress: bool) -> bytes:
+    """
+    Serialize a JSON request body, gzip-compressing it when requested.
+
+    Compression uses the fastest level; page content is highly compressible
+    and the goal is fewer bytes on the wire, not the smallest payload.
+    """
+    body = orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8')
+    headers['Content-Type'] = 'application/json'
+    if compress:
+        body = gzip.compress(body, compresslevel=1)
+        headers['Content-Encoding'] = 'gzip'
+    return body
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed
+
+    Args:
+        response: httpx.Response with a JSON body
+
+    Returns:
+        Decoded JSON value
+    """
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def post_json(
     url: str,
     data: Dict[str, Any],
     timeout: int = 60,
-    headers: Optional[Dict[str, str]] = None
+    headers: Optional[Dict[str, str]] = None,
+    compress: bool = False
 ) -> httpx.Response:
     """
     Make a synchronous POST request with JSON data
@@ -153,22 +191,24 @@ def post_json(
         data: Dictionary to send as JSON
         timeout: Request timeout in seconds
         headers: Optional additional headers
+        compress: Send the body gzip-encoded (server must accept Content-Encoding: gzip)
         
     Returns:
         httpx.Response object
     """
     request_headers = headers or {}
-    request_headers['Content-Type'] = 'application/json'
+    body = _encode_json_body(data, request_headers, compress)
     
     with HTTPClient(timeout=timeout, headers=request_headers) as client:
-        return client.post(url, json=data)
+        return client.post(url, content=body)
 
 
 async def post_json_async(
     url: str,
     data: Dict[str, Any],
     timeout: int = 60,
-    headers: Optional[Dict[str, str]] = None
+    headers: Optional[Dict[str, str]] = None,
+    compress: bool = False
 ) -> httpx.Response:
     """
     Make an asynchronous POST request with JSON data
@@ -178,12 +218,13 @@ async def post_json_async(
         data: Dictionary to send as JSON
         timeout: Request timeout in seconds
         headers: Optional additional headers
+        compress: Send the body gzip-encoded (server must accept Content-Encoding: gzip)
         
     Returns:
         httpx.Response object
     """
     request_headers = headers or {}
-    request_headers['Content-Type'] = 'application/json'
+    body = _encode_json_body(data, request_headers, compress)
     
     async with AsyncHTTPClient(timeout=timeout, headers=request_headers) as client:
-        return await client.post(url, json=data)
\ No newline at end of file
+        return await client.post(url, content=body)
\ No newline at end of file
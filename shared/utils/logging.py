@@ -3,10 +3,15 @@ Shared logging utilities for consistent logging across the application
 """
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 from shared.config import config
 
 
+# Resolve the default level once; config is loaded at import time and does not change
+_DEFAULT_LEVEL = 'DEBUG' if config.application.debug else 'INFO'
+
+
 def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     """
     Get a logger with consistent configuration
@@ -18,6 +23,12 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    return _get_logger_cached(name, (level or _DEFAULT_LEVEL).upper())
+
+
+@lru_cache(maxsize=None)
+def _get_logger_cached(name: str, level: str) -> logging.Logger:
+    """Configure a logger on first use; later calls return the cached instance."""
     logger = logging.getLogger(name)
     
     # Don't add handlers if they already exist
@@ -25,8 +36,7 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         return logger
     
     # Set level based on config or parameter
-    log_level = level or ('DEBUG' if config.application.debug else 'INFO')
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(getattr(logging, level))
     
     # Create console handler
     handler = logging.StreamHandler(sys.stdout)
@@ -48,32 +58,36 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
 def log_task_start(task_type: str, url: str, scan_id: int):
     """Log the start of a task with consistent formatting"""
     logger = get_logger(__name__)
-    logger.info(f"Starting {task_type} scan pipeline for URL: {url}, scan_id: {scan_id}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Starting %s scan pipeline for URL: %s, scan_id: %s", task_type, url, scan_id)
 
 
 def log_task_complete(task_type: str, url: str, scan_id: int, success: bool):
     """Log the completion of a task with consistent formatting"""
     logger = get_logger(__name__)
-    status = "successfully" if success else "with errors"
-    logger.info(f"Completed {task_type} scan {status} for URL: {url}, scan_id: {scan_id}")
+    if logger.isEnabledFor(logging.INFO):
+        status = "successfully" if success else "with errors"
+        logger.info("Completed %s scan %s for URL: %s, scan_id: %s", task_type, status, url, scan_id)
 
 
 def log_phase_transition(phase: str, scan_id: int):
     """Log phase transitions in scan processing"""
     logger = get_logger(__name__)
-    logger.info(f"Scan {scan_id}: Transitioning to {phase} phase")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Scan %s: Transitioning to %s phase", scan_id, phase)
 
 
 def log_metrics(metrics: dict, scan_id: int):
     """Log scan metrics in a consistent format"""
     logger = get_logger(__name__)
-    logger.info(f"Scan {scan_id} metrics: {metrics}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Scan %s metrics: %s", scan_id, metrics)
 
 
 def log_error(message: str, exception: Optional[Exception] = None):
     """Log errors with optional exception details"""
     logger = get_logger(__name__)
     if exception:
-        logger.error(f"{message}: {str(exception)}", exc_info=True)
+        logger.error("%s: %s", message, exception, exc_info=True)
     else:
-        logger.error(message)
\ No newline at end of file
+        logger.error(message)
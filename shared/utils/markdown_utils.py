@@ -6,6 +6,49 @@ Provides consistent title extraction logic across all services.
 import re
 from typing import Optional
 
+# Patterns compiled once at import instead of going through re's pattern cache
+# on every call. Only the opening fence line is a regex; the closing fence is
+# found with str.find (see extract_yaml_frontmatter)
+_FRONTMATTER_OPEN_RE = re.compile(r'---\s*\n')
+
+# Match title with or without quotes, handling escaped quotes
+# Pattern explanation:
+# - title:\s* - Match "title:" followed by optional whitespace
+# - (?:"([^"\\]*(?:\\.[^"\\]*)*)"|'([^'\\]*(?:\\.[^'\\]*)*)'|(.+?)) - Match:
+#   1. Double-quoted string with escaped characters
+#   2. Single-quoted string with escaped characters
+#   3. Unquoted string (non-greedy)
+# - \s*$ - Optional trailing whitespace to end of line
+_TITLE_LINE_RE = re.compile(
+    r'^title:\s*(?:"([^"\\]*(?:\\.[^"\\]*)*)"|\'([^\'\\]*(?:\\.[^\'\\]*)*)\'|(.+?))\s*$',
+    re.MULTILINE
+)
+
+_H1_RE = re.compile(r'^#\s+(.+?)(?:\s*#*)?\s*$', re.MULTILINE)
+_H2_RE = re.compile(r'^##\s+(.+?)(?:\s*#*)?\s*$', re.MULTILINE)
+
+
+def _find_heading(pattern: re.Pattern, content: str) -> Optional[re.Match]:
+    """
+    Return the first match of a heading pattern, like ``pattern.search``.
+    
+    Headings start with '#' at the beginning of a line, so only those
+    positions are tried (found with str.find) instead of letting the regex
+    walk every line of the document. ``^`` still checks the preceding newline
+    when matching from an offset.
+    """
+    if content.startswith('#'):
+        match = pattern.match(content)
+        if match:
+            return match
+    pos = content.find('\n#')
+    while pos != -1:
+        match = pattern.match(content, pos + 1)
+        if match:
+            return match
+        pos = content.find('\n#', pos + 1)
+    return None
+
 
 def extract_yaml_frontmatter(content: str) -> Optional[str]:
     """
@@ -20,9 +63,24 @@ def extract_yaml_frontmatter(content: str) -> Optional[str]:
     if not content:
         return None
     
-    frontmatter_match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if frontmatter_match:
-        return frontmatter_match.group(1)
+    # Same result as matching r'^---\s*\n(.*?)\n---' with DOTALL, without the
+    # regex retrying the body scan from every newline of a long blank run
+    # (quadratic on a fence followed by thousands of empty lines)
+    opening = _FRONTMATTER_OPEN_RE.match(content)
+    if not opening:
+        return None
+    
+    start = opening.end()
+    end = content.find('\n---', start)
+    if end != -1:
+        return content[start:end]
+    
+    # The closing fence can only be the line right after the opening run,
+    # with the body starting after the run's previous newline
+    if content.startswith('---', start):
+        prev = content.rfind('\n', 3, start - 1)
+        if prev != -1:
+            return content[prev + 1:start - 1]
     
     return None
 
@@ -37,22 +95,12 @@ def extract_title_from_frontmatter(frontmatter: str) -> Optional[str]:
     Returns:
         The title value, or None if not found
     """
-    if not frontmatter:
+    # Most blocks are small, but a substring check still spares the line-by-line
+    # regex scan for frontmatter without a title key
+    if not frontmatter or 'title:' not in frontmatter:
         return None
     
-    # Match title with or without quotes, handling escaped quotes
-    # Pattern explanation:
-    # - title:\s* - Match "title:" followed by optional whitespace
-    # - (?:"([^"\\]*(?:\\.[^"\\]*)*)"|'([^'\\]*(?:\\.[^'\\]*)*)'|(.+?)) - Match:
-    #   1. Double-quoted string with escaped characters
-    #   2. Single-quoted string with escaped characters
-    #   3. Unquoted string (non-greedy)
-    # - \s*$ - Optional trailing whitespace to end of line
-    title_match = re.search(
-        r'^title:\s*(?:"([^"\\]*(?:\\.[^"\\]*)*)"|\'([^\'\\]*(?:\\.[^\'\\]*)*)\'|(.+?))\s*$',
-        frontmatter,
-        re.MULTILINE
-    )
+    title_match = _TITLE_LINE_RE.search(frontmatter)
     if title_match:
         # Return the first non-None group (double-quoted, single-quoted, or unquoted)
         title = title_match.group(1) or title_match.group(2) or title_match.group(3)
@@ -86,13 +134,18 @@ def extract_title_from_markdown(content: str) -> str:
         if title:
             return title
     
+    # Both heading patterns need a '#', and a substring check is far cheaper
+    # than two line-by-line regex scans of a page that has no headings
+    if '#' not in content:
+        return ""
+    
     # Try first # heading
-    h1_match = re.search(r'^#\s+(.+?)(?:\s*#*)?\s*$', content, re.MULTILINE)
+    h1_match = _find_heading(_H1_RE, content)
     if h1_match:
         return h1_match.group(1).strip()
     
     # Try first ## heading as fallback
-    h2_match = re.search(r'^##\s+(.+?)(?:\s*#*)?\s*$', content, re.MULTILINE)
+    h2_match = _find_heading(_H2_RE, content)
     if h2_match:
         return h2_match.group(1).strip()
     
@@ -153,6 +153,12 @@ class AppMetrics:
             registry=self.registry
         )
         
+        self.active_mcp_requests = Gauge(
+            'azuredocs_active_mcp_requests',
+            'Number of MCP holistic scoring requests currently in flight',
+            registry=self.registry
+        )
+        
         # === OPERATIONAL METRICS ===
         
         # Database metrics
@@ -260,9 +266,10 @@ class AppMetrics:
         self.documents_processed.labels(source=source, status=status).inc()
         self.document_processing_duration.labels(source=source).observe(duration_seconds)
         
-    def record_bias_detected(self, detection_method: str, bias_type: str = 'windows'):
-        """Record that bias has been detected"""
-        self.bias_detected.labels(detection_method=detection_method, bias_type=bias_type).inc()
+    def record_bias_detected(self, detection_method: str, bias_type: str = 'windows', count: int = 1):
+        """Record that bias has been detected (``count`` times, for batched callers)"""
+        if count > 0:
+            self.bias_detected.labels(detection_method=detection_method, bias_type=bias_type).inc(count)
         
     def record_snippet_analyzed(self, analysis_type: str):
         """Record that a snippet has been analyzed"""
@@ -302,6 +309,14 @@ class AppMetrics:
     def update_api_rate_limit(self, service: str, remaining: int):
         """Update API rate limit remaining"""
         self.api_rate_limit_remaining.labels(service=service).set(remaining)
+        
+    def record_mcp_request_started(self):
+        """Record that an MCP holistic scoring request is in flight"""
+        self.active_mcp_requests.inc()
+        
+    def record_mcp_request_finished(self):
+        """Record that an in-flight MCP holistic scoring request has finished"""
+        self.active_mcp_requests.dec()
     
     # === OPERATIONAL METRIC HELPERS ===
     
@@ -1,12 +1,39 @@
 """URL utility functions for detecting source types."""
 
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import urlsplit
 from typing import Optional
 import re
 
 from shared.config import AZURE_DOCS_REPOS, get_repo_from_url
 
 
+# Doc set patterns for URLs outside the tracked repos, compiled once
+_GITHUB_REPO_RE = re.compile(r'github\.com/[^/]+/([^/]+)')
+_LEARN_AZURE_SERVICE_RE = re.compile(r'learn\.microsoft\.com/[^/]+/azure/([^/]+)')
+_LEARN_PRODUCT_RE = re.compile(r'learn\.microsoft\.com/[^/]+/([^/]+)')
+
+
+@lru_cache(maxsize=64)
+def _repo_service_re(name: str, public_name: str, articles_path: str) -> re.Pattern:
+    """Compile the service pattern for one tracked repo (keyed by its fields)."""
+    # Pattern: github.com/{owner}/{repo}/blob/{branch}/articles/{service}/...
+    # Match against both private and public repo names
+    return re.compile(
+        rf'(?:{re.escape(name)}|{re.escape(public_name)})/blob/[^/]+/{re.escape(articles_path)}/([^/]+)',
+        re.IGNORECASE
+    )
+
+
+# Source type by host (lowercased, without a leading www.)
+_URL_SOURCES = {
+    'github.com': "github",
+    'learn.microsoft.com': "ms-learn",
+}
+
+
+# Pure function of the URL, and the same few URLs are rendered over and over
+@lru_cache(maxsize=4096)
 def detect_url_source(url: Optional[str]) -> str:
     """
     Detect the source type based on the URL.
@@ -21,21 +48,12 @@ def detect_url_source(url: Optional[str]) -> str:
         return "unknown"
     
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        
-        # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        
-        if domain == 'github.com':
-            return "github"
-        elif domain == 'learn.microsoft.com':
-            return "ms-learn"
-        else:
-            return "unknown"
+        # urlsplit skips urlparse's ;params handling, which the host doesn't need
+        domain = urlsplit(url).netloc.lower().removeprefix('www.')
     except Exception:
         return "unknown"
+    
+    return _URL_SOURCES.get(domain, "unknown")
 
 
 def extract_doc_set_from_url(url: str) -> Optional[str]:
@@ -58,10 +76,8 @@ def extract_doc_set_from_url(url: str) -> Optional[str]:
             # Check if it's one of our tracked repos
             repo = get_repo_from_url(url)
             if repo:
-                # Pattern: github.com/{owner}/{repo}/blob/{branch}/articles/{service}/...
-                # Match against both private and public repo names
-                pattern = rf'(?:{re.escape(repo.name)}|{re.escape(repo.public_name)})/blob/[^/]+/{re.escape(repo.articles_path)}/([^/]+)'
-                match = re.search(pattern, url, re.IGNORECASE)
+                pattern = _repo_service_re(repo.name, repo.public_name, repo.articles_path)
+                match = pattern.search(url)
                 if match:
                     service = match.group(1)
                     # Return the specific Azure service as the docset
@@ -70,18 +86,18 @@ def extract_doc_set_from_url(url: str) -> Optional[str]:
                 return repo.public_name
 
             # For other GitHub repos, extract repo name
-            match = re.search(r'github\.com/[^/]+/([^/]+)', url)
+            match = _GITHUB_REPO_RE.search(url)
             if match:
                 return match.group(1)
 
         # For learn.microsoft.com URLs, extract the product/service
         elif 'learn.microsoft.com' in url:
             # Pattern: learn.microsoft.com/{locale}/azure/{service}/...
-            match = re.search(r'learn\.microsoft\.com/[^/]+/azure/([^/]+)', url)
+            match = _LEARN_AZURE_SERVICE_RE.search(url)
             if match:
                 return match.group(1)
             # Pattern: learn.microsoft.com/{locale}/{product}/...
-            match = re.search(r'learn\.microsoft\.com/[^/]+/([^/]+)', url)
+            match = _LEARN_PRODUCT_RE.search(url)
             if match:
                 return match.group(1)
 
@@ -90,6 +106,41 @@ def extract_doc_set_from_url(url: str) -> Optional[str]:
         return None
 
 
+# Title-cased words that should be shown in their usual capitalization
+_DOC_SET_SPECIAL_CASES = {
+    'Api': 'API',
+    'Ai': 'AI',
+    'Ml': 'ML',
+    'Iot': 'IoT',
+    'Sql': 'SQL',
+    'Vm': 'VM',
+    'Vms': 'VMs',
+    'Cli': 'CLI',
+    'Sdk': 'SDK',
+    'Id': 'ID',
+    'Ip': 'IP',
+    'Dns': 'DNS',
+    'Vpn': 'VPN',
+    'Cdn': 'CDN',
+    'Http': 'HTTP',
+    'Https': 'HTTPS',
+    'Json': 'JSON',
+    'Xml': 'XML',
+    'Yaml': 'YAML',
+    'Rest': 'REST',
+    'Blob': 'Blob'
+}
+
+# One alternation so a name is rewritten in a single pass rather than one
+# re.sub per special case; replacements never create a new match, so this is
+# the same as applying them one after another
+_DOC_SET_SPECIAL_CASES_RE = re.compile(
+    r'\b(' + '|'.join(sorted(_DOC_SET_SPECIAL_CASES, key=len, reverse=True)) + r')\b'
+)
+
+
+# Doc set names are a small, fixed vocabulary rendered on every PR list
+@lru_cache(maxsize=256)
 def format_doc_set_name(doc_set: Optional[str]) -> str:
     """
     Format a documentation set name for display.
@@ -110,31 +161,6 @@ def format_doc_set_name(doc_set: Optional[str]) -> str:
     formatted = formatted.title()
     
     # Special cases
-    replacements = {
-        'Api': 'API',
-        'Ai': 'AI',
-        'Ml': 'ML',
-        'Iot': 'IoT',
-        'Sql': 'SQL',
-        'Vm': 'VM',
-        'Vms': 'VMs',
-        'Cli': 'CLI',
-        'Sdk': 'SDK',
-        'Id': 'ID',
-        'Ip': 'IP',
-        'Dns': 'DNS',
-        'Vpn': 'VPN',
-        'Cdn': 'CDN',
-        'Http': 'HTTP',
-        'Https': 'HTTPS',
-        'Json': 'JSON',
-        'Xml': 'XML',
-        'Yaml': 'YAML',
-        'Rest': 'REST',
-        'Blob': 'Blob'
-    }
-    
-    for old, new in replacements.items():
-        formatted = re.sub(r'\b' + old + r'\b', new, formatted)
-    
-    return formatted
+    return _DOC_SET_SPECIAL_CASES_RE.sub(
+        lambda match: _DOC_SET_SPECIAL_CASES[match.group(1)], formatted
+    )
@@ -2,26 +2,54 @@
 Shared pytest fixtures for all tests.
 """
 import pytest
-from unittest.mock import MagicMock
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
+from shared.config import AzureDocsRepo
 from shared.models import Base, Scan, Page, Snippet
+from tests.fixtures.pages import StubPage
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create an in-memory SQLite database engine for tests."""
-    engine = create_engine("sqlite:///:memory:")
+    """Create a shared in-memory SQLite database engine for tests.
+
+    StaticPool keeps a single connection so every session sees the same
+    in-memory database, and the schema is created once per test run. Under
+    pytest-xdist each worker process builds its own private database, so
+    workers never share state.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # Let SQLAlchemy own transaction boundaries so the per-test SAVEPOINTs
+    # below actually roll back (pysqlite otherwise emits its own BEGIN/COMMIT)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    return engine
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
 def db_session(db_engine):
-    """Create a database session for tests."""
-    with Session(db_engine) as session:
+    """Create a database session for tests, rolled back after each test."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
         yield session
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -69,35 +97,54 @@ def sample_snippet(db_session, sample_page):
     return snippet
 
 
+@pytest.fixture(scope="session")
+def canonical_repo():
+    """The default tracked docs repo; shared by every test that needs one."""
+    return AzureDocsRepo(owner="MicrosoftDocs", name="azure-docs-pr", public_name="azure-docs")
+
+
+@pytest.fixture(scope="session")
+def canonical_repos(canonical_repo):
+    """Tracked repo list containing only the canonical repo."""
+    return [canonical_repo]
+
+
+@pytest.fixture
+def tracked_repos(monkeypatch, canonical_repos):
+    """Point shared.config.AZURE_DOCS_REPOS at the canonical repo list."""
+    monkeypatch.setattr("shared.config.AZURE_DOCS_REPOS", canonical_repos)
+    return canonical_repos
+
+
+@pytest.fixture
+def page_factory():
+    """Build StubPage objects from an mcp_holistic payload."""
+    return StubPage
+
+
 @pytest.fixture
 def mock_page_with_bias():
     """Create a mock page object with bias data."""
-    page = MagicMock()
-    page.mcp_holistic = {
+    return StubPage({
         "bias_types": ["powershell_only", "windows_paths"],
         "summary": "Uses PowerShell and Windows paths",
         "recommendations": ["Add bash alternatives"]
-    }
-    return page
+    })
 
 
 @pytest.fixture
 def mock_page_without_bias():
     """Create a mock page object without bias data."""
-    page = MagicMock()
-    page.mcp_holistic = {
+    return StubPage({
         "bias_types": [],
         "summary": "Cross-platform documentation"
-    }
-    return page
+    })
 
 
 @pytest.fixture
 def mock_page_no_mcp():
     """Create a mock page object with no MCP data."""
-    page = MagicMock()
-    page.mcp_holistic = None
-    return page
+    return StubPage(None)
 
 
 @pytest.fixture
@@ -0,0 +1,24 @@
+"""
+Lightweight page stand-ins for tests of code that only reads ``mcp_holistic``.
+"""
+
+# Shared mcp_holistic payloads; bias_utils only reads them, never mutates
+NO_BIAS = {"bias_types": []}
+ONE_BIAS = {"bias_types": ["powershell_only"]}
+TWO_BIAS = {"bias_types": ["powershell_only", "windows_paths"]}
+THREE_BIAS = {"bias_types": ["powershell_only", "windows_paths", "missing_linux"]}
+
+
+class StubPage:
+    """
+    Minimal page object with the attributes bias_utils touches.
+
+    ``_parsed_mcp_holistic`` is an unset slot until bias_utils caches into it,
+    so ``hasattr(page, '_parsed_mcp_holistic')`` is False on a fresh stub just
+    as it is on a freshly loaded Page model.
+    """
+
+    __slots__ = ("mcp_holistic", "_parsed_mcp_holistic")
+
+    def __init__(self, mcp_holistic=None):
+        self.mcp_holistic = mcp_holistic
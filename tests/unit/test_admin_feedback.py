@@ -5,152 +5,64 @@ Tests cover:
 - get_admin_feedback helper function with pagination, filtering, and sorting
 - /admin/feedback endpoint with session authentication
 
-Note: The get_admin_feedback function is duplicated here rather than imported
-because importing from services.web.src.routes.admin requires FastAPI and
-jinja2 template dependencies that create circular import issues in the test
-environment. This is a pragmatic solution to enable isolated unit testing.
-If the function signature or logic changes in admin.py, this copy must be
-updated as well. Consider extracting the function to a separate utility module
-if this becomes a maintenance burden.
+get_admin_feedback lives in services/web/src/utils/feedback_queries.py, which
+has no FastAPI/Jinja2 imports, so it is tested directly against the shared
+in-memory database.
 """
 import pytest
 import sys
 import os
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
-from sqlalchemy import create_engine, func, case, or_
-from sqlalchemy.orm import Session, joinedload
-from typing import Optional
+from sqlalchemy import event, insert
+from sqlalchemy.engine.default import CACHE_HIT
 
 # Add services/web/src to path to allow imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../services/web/src'))
 
-from shared.models import Base, UserFeedback, User, Snippet, Page, Scan, RewrittenDocument
-
-
-# Function under test - copied from services/web/src/routes/admin.py
-# NOTE: This is duplicated to avoid import issues with FastAPI/Jinja2 dependencies.
-# Keep this synchronized with the original if changes are made.
-def get_admin_feedback(
-    db,
-    page: int = 1,
-    per_page: int = 25,
-    target_type: Optional[str] = None,
-    rating: Optional[str] = None,
-    has_comment: Optional[str] = None,
-    sort_by: str = "date",
-    sort_order: str = "desc"
-):
-    """
-    Query feedback with server-side pagination, filtering, and sorting.
-    
-    This is a copy of the function from services/web/src/routes/admin.py:get_admin_feedback
-    """
-    # Validate and cap per_page
-    per_page = min(max(1, per_page), 100)
-    page = max(1, page)
-
-    # Base query with eager loading
-    query = db.query(UserFeedback).options(
-        joinedload(UserFeedback.user),
-        joinedload(UserFeedback.snippet),
-        joinedload(UserFeedback.page),
-        joinedload(UserFeedback.rewritten_document)
-    )
+from shared.models import UserFeedback, User, Snippet, Page, Scan, RewrittenDocument
+from utils.feedback_queries import get_admin_feedback, _feedback_stats_cache, _feedback_user_cache
 
-    # Apply filters
-    if target_type:
-        if target_type == "snippet":
-            query = query.filter(UserFeedback.snippet_id.isnot(None))
-        elif target_type == "page":
-            query = query.filter(UserFeedback.page_id.isnot(None))
-        elif target_type == "rewritten":
-            query = query.filter(UserFeedback.rewritten_document_id.isnot(None))
-
-    if rating:
-        if rating == "up":
-            query = query.filter(UserFeedback.rating.is_(True))
-        elif rating == "down":
-            query = query.filter(UserFeedback.rating.is_(False))
-
-    if has_comment:
-        if has_comment == "yes":
-            query = query.filter(
-                UserFeedback.comment.isnot(None),
-                func.length(func.trim(UserFeedback.comment)) > 0
-            )
-        elif has_comment == "no":
-            query = query.filter(
-                or_(
-                    UserFeedback.comment.is_(None),
-                    func.length(func.trim(UserFeedback.comment)) == 0
-                )
-            )
 
-    # Apply sorting
-    if sort_by == "rating":
-        order_col = UserFeedback.rating
-    else:  # default to date
-        order_col = UserFeedback.created_at
-
-    if sort_order == "asc":
-        query = query.order_by(order_col.asc())
-    else:
-        query = query.order_by(order_col.desc())
-
-    # Get total count (before pagination)
-    total = query.count()
-    total_pages = (total + per_page - 1) // per_page if total > 0 else 1
-
-    # Apply pagination
-    offset = (page - 1) * per_page
-    feedback_items = query.offset(offset).limit(per_page).all()
-
-    # Get stats using aggregation
-    stats_query = db.query(
-        func.count(UserFeedback.id).label('total'),
-        func.sum(case((UserFeedback.rating.is_(True), 1), else_=0)).label('thumbs_up'),
-        func.sum(case((UserFeedback.rating.is_(False), 1), else_=0)).label('thumbs_down'),
-        func.sum(case((func.coalesce(func.length(func.trim(UserFeedback.comment)), 0) > 0, 1), else_=0)).label('has_comments')
-    ).first()
-
-    stats = {
-        'total': stats_query.total or 0,
-        'thumbs_up': stats_query.thumbs_up or 0,
-        'thumbs_down': stats_query.thumbs_down or 0,
-        'has_comments': stats_query.has_comments or 0
-    }
-
-    return {
-        'items': feedback_items,
-        'pagination': {
-            'page': page,
-            'per_page': per_page,
-            'total': total,
-            'total_pages': total_pages,
-            'has_prev': page > 1,
-            'has_next': page < total_pages,
-            'start_idx': offset + 1 if total > 0 else 0,
-            'end_idx': min(offset + per_page, total)
-        },
-        'stats': stats
-    }
+@contextmanager
+def count_queries(session):
+    """Collect the SQL statements executed on the session's engine.
+
+    SAVEPOINT bookkeeping from the per-test transaction is not counted.
+    """
+    statements = []
+    engine = session.get_bind()
 
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            statements.append(statement)
 
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
 
-@pytest.fixture
-def test_db_engine():
-    """Create an in-memory SQLite database engine for tests."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
+
+@pytest.fixture(autouse=True)
+def clear_feedback_stats_cache():
+    """Each test builds its own database, so start with no cached stats or users."""
+    _feedback_stats_cache.invalidate_all()
+    _feedback_user_cache.invalidate_all()
+    yield
+    _feedback_stats_cache.invalidate_all()
+    _feedback_user_cache.invalidate_all()
 
 
 @pytest.fixture
-def test_db_session(test_db_engine):
-    """Create a database session for tests."""
-    with Session(test_db_engine) as session:
-        yield session
+def test_db_session(db_session):
+    """Database session for tests.
+
+    Uses the shared session-scoped in-memory schema from conftest; everything
+    a test writes is rolled back when it finishes.
+    """
+    return db_session
 
 
 @pytest.fixture
@@ -226,6 +138,7 @@ def sample_rewritten_document(test_db_session, sample_scan_with_page):
 def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_with_page, sample_rewritten_document):
     """Create a diverse set of feedback items for testing pagination, filtering, and sorting."""
     _, page = sample_scan_with_page
+    now = datetime.now(timezone.utc)
     
     feedback_items = []
     
@@ -236,7 +149,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         snippet_id=sample_snippet.id,
         rating=True,
         comment="This is helpful!",
-        created_at=datetime.utcnow() - timedelta(days=10)
+        created_at=now - timedelta(days=10)
     ))
     
     # 2. Snippet feedback with thumbs down and comment
@@ -245,7 +158,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         snippet_id=sample_snippet.id,
         rating=False,
         comment="Needs improvement",
-        created_at=datetime.utcnow() - timedelta(days=9)
+        created_at=now - timedelta(days=9)
     ))
     
     # 3. Page feedback with thumbs up, no comment
@@ -254,7 +167,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         page_id=page.id,
         rating=True,
         comment=None,
-        created_at=datetime.utcnow() - timedelta(days=8)
+        created_at=now - timedelta(days=8)
     ))
     
     # 4. Page feedback with thumbs down and comment
@@ -263,7 +176,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         page_id=page.id,
         rating=False,
         comment="Not accurate",
-        created_at=datetime.utcnow() - timedelta(days=7)
+        created_at=now - timedelta(days=7)
     ))
     
     # 5. Rewritten document feedback with thumbs up and comment
@@ -272,7 +185,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         rewritten_document_id=sample_rewritten_document.id,
         rating=True,
         comment="Great rewrite!",
-        created_at=datetime.utcnow() - timedelta(days=6)
+        created_at=now - timedelta(days=6)
     ))
     
     # 6. Rewritten document feedback with thumbs down, no comment
@@ -281,7 +194,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         rewritten_document_id=sample_rewritten_document.id,
         rating=False,
         comment=None,
-        created_at=datetime.utcnow() - timedelta(days=5)
+        created_at=now - timedelta(days=5)
     ))
     
     # 7. Snippet feedback with thumbs up, empty string comment (should count as no comment)
@@ -290,7 +203,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         snippet_id=sample_snippet.id,
         rating=True,
         comment="   ",  # whitespace only
-        created_at=datetime.utcnow() - timedelta(days=4)
+        created_at=now - timedelta(days=4)
     ))
     
     # 8. Page feedback with thumbs up and comment
@@ -299,7 +212,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         page_id=page.id,
         rating=True,
         comment="Very clear documentation",
-        created_at=datetime.utcnow() - timedelta(days=3)
+        created_at=now - timedelta(days=3)
     ))
     
     # 9. Snippet feedback with thumbs down, no comment
@@ -308,7 +221,7 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         snippet_id=sample_snippet.id,
         rating=False,
         comment=None,
-        created_at=datetime.utcnow() - timedelta(days=2)
+        created_at=now - timedelta(days=2)
     ))
     
     # 10. Rewritten document feedback with thumbs up and comment (most recent)
@@ -317,17 +230,13 @@ def feedback_data_set(test_db_session, sample_user, sample_snippet, sample_scan_
         rewritten_document_id=sample_rewritten_document.id,
         rating=True,
         comment="Perfect!",
-        created_at=datetime.utcnow() - timedelta(days=1)
+        created_at=now - timedelta(days=1)
     ))
     
-    for feedback in feedback_items:
-        test_db_session.add(feedback)
-    
+    # One batched INSERT; nothing below needs server-side values reloaded
+    test_db_session.add_all(feedback_items)
     test_db_session.commit()
     
-    for feedback in feedback_items:
-        test_db_session.refresh(feedback)
-    
     return feedback_items
 
 
@@ -395,6 +304,34 @@ class TestGetAdminFeedbackPagination:
         assert result['pagination']['start_idx'] == 4
         assert result['pagination']['end_idx'] == 6
     
+    def test_next_cursor_matches_offset_pagination(self, test_db_session, feedback_data_set):
+        """Test that following next_cursor returns the same page as OFFSET."""
+        for sort_by, sort_order in [("date", "desc"), ("date", "asc"), ("rating", "desc"), ("rating", "asc")]:
+            first = get_admin_feedback(test_db_session, per_page=4, sort_by=sort_by, sort_order=sort_order)
+            cursor = first['pagination']['next_cursor']
+            assert cursor is not None
+            
+            by_cursor = get_admin_feedback(
+                test_db_session, page=2, per_page=4,
+                sort_by=sort_by, sort_order=sort_order, after=cursor
+            )
+            by_offset = get_admin_feedback(test_db_session, page=2, per_page=4, sort_by=sort_by, sort_order=sort_order)
+            
+            assert [item.id for item in by_cursor['items']] == [item.id for item in by_offset['items']]
+    
+    def test_no_next_cursor_on_last_page(self, test_db_session, feedback_data_set):
+        """Test that the last page has no next cursor."""
+        result = get_admin_feedback(test_db_session, page=2, per_page=5)
+        
+        assert result['pagination']['next_cursor'] is None
+    
+    def test_invalid_cursor_falls_back_to_offset(self, test_db_session, feedback_data_set):
+        """Test that a malformed cursor is ignored in favour of OFFSET pagination."""
+        by_offset = get_admin_feedback(test_db_session, page=2, per_page=3)
+        result = get_admin_feedback(test_db_session, page=2, per_page=3, after="not-a-cursor")
+        
+        assert [item.id for item in result['items']] == [item.id for item in by_offset['items']]
+    
     def test_empty_result_pagination(self, test_db_session):
         """Test pagination with no results."""
         result = get_admin_feedback(test_db_session)
@@ -476,6 +413,24 @@ class TestGetAdminFeedbackFiltering:
         for item in result['items']:
             assert item.comment is None or len(item.comment.strip()) == 0
     
+    def test_blank_comment_stored_as_null(self, test_db_session, feedback_data_set):
+        """Test that whitespace-only comments are normalized to NULL on write."""
+        whitespace_item = feedback_data_set[6]
+        
+        assert whitespace_item.comment is None
+        assert feedback_data_set[0].comment == "This is helpful!"
+    
+    def test_comment_filter_needs_no_string_functions(self, test_db_session, feedback_data_set):
+        """Test that comment filters and stats compare against NULL rather than trimming per row."""
+        with count_queries(test_db_session) as statements:
+            get_admin_feedback(test_db_session, has_comment="yes")
+            get_admin_feedback(test_db_session, has_comment="no")
+        
+        sql = " ".join(statements).lower()
+        assert "comment is not null" in sql
+        assert "comment is null" in sql
+        assert "trim(" not in sql and "length(" not in sql
+    
     def test_combined_filters(self, test_db_session, feedback_data_set):
         """Test combining multiple filters."""
         # Filter for snippet feedback with thumbs down
@@ -566,6 +521,19 @@ class TestGetAdminFeedbackSorting:
         assert all(ratings[i] is False for i in range(false_count))
         assert all(ratings[i] is True for i in range(false_count, false_count + true_count))
     
+    def test_sort_by_rating_breaks_ties_by_id(self, test_db_session, feedback_data_set):
+        """Test that rows with equal ratings are ordered by id, so pages never overlap."""
+        pages = [
+            get_admin_feedback(test_db_session, page=n, per_page=3, sort_by="rating", sort_order="desc")['items']
+            for n in range(1, 5)
+        ]
+        items = [item for page in pages for item in page]
+        
+        assert [(item.rating, item.id) for item in items] == sorted(
+            ((item.rating, item.id) for item in items), reverse=True
+        )
+        assert len({item.id for item in items}) == len(feedback_data_set)
+    
     def test_sorting_with_filters(self, test_db_session, feedback_data_set):
         """Test sorting combined with filtering."""
         result = get_admin_feedback(
@@ -595,14 +563,66 @@ class TestGetAdminFeedbackStats:
         assert stats['has_comments'] == 6  # Items with non-empty comments
     
     def test_stats_with_filters(self, test_db_session, feedback_data_set):
-        """Test that stats reflect the global data, not filtered results."""
+        """Test that stats reflect the filtered subset, not all feedback."""
         result = get_admin_feedback(test_db_session, target_type="snippet")
         
-        # Stats should still reflect all feedback, not just filtered
+        # Snippet feedback only: items 1, 2, 7 and 9
         stats = result['stats']
-        assert stats['total'] == 10  # Total across all types
-        assert stats['thumbs_up'] == 6
-        assert stats['thumbs_down'] == 4
+        assert stats['total'] == 4
+        assert stats['thumbs_up'] == 2
+        assert stats['thumbs_down'] == 2
+        assert stats['has_comments'] == 2
+    
+    def test_stats_cached_between_calls(self, test_db_session, feedback_data_set):
+        """Test that repeated calls with the same filters reuse cached stats."""
+        first = get_admin_feedback(test_db_session, rating="up")
+        
+        with patch.object(_feedback_stats_cache, 'set') as mock_set:
+            second = get_admin_feedback(test_db_session, rating="up", page=2, per_page=2)
+        
+        mock_set.assert_not_called()
+        assert second['stats'] == first['stats']
+    
+    def test_warm_call_skips_the_stats_aggregate(self, test_db_session, feedback_data_set):
+        """Test that a cached call only checks the table version before reusing stats."""
+        get_admin_feedback(test_db_session, target_type="snippet")
+        
+        with count_queries(test_db_session) as statements:
+            result = get_admin_feedback(test_db_session, target_type="snippet", page=2, per_page=2)
+        
+        assert result['pagination']['total'] == 4
+        assert not any("sum(case" in statement.lower() for statement in statements)
+    
+    def test_stats_refreshed_after_write_from_another_process(self, test_db_session, feedback_data_set, sample_user, sample_snippet):
+        """Test that rows written without this process's ORM events still update the total."""
+        assert get_admin_feedback(test_db_session, per_page=5)['pagination']['total'] == 10
+        
+        # A Core insert fires no mapper events, like a write made by another replica
+        test_db_session.execute(insert(UserFeedback).values(
+            user_id=sample_user.id,
+            snippet_id=sample_snippet.id,
+            rating=True,
+        ))
+        
+        result = get_admin_feedback(test_db_session, per_page=5)
+        assert result['stats']['total'] == 11
+        assert result['pagination']['total_pages'] == 3
+        assert result['pagination']['has_next'] is True
+    
+    def test_stats_cache_invalidated_on_insert(self, test_db_session, feedback_data_set, sample_user, sample_snippet):
+        """Test that writing feedback refreshes the cached stats."""
+        assert get_admin_feedback(test_db_session)['stats']['total'] == 10
+        
+        test_db_session.add(UserFeedback(
+            user_id=sample_user.id,
+            snippet_id=sample_snippet.id,
+            rating=True,
+        ))
+        test_db_session.commit()
+        
+        result = get_admin_feedback(test_db_session)
+        assert result['stats']['total'] == 11
+        assert result['pagination']['total'] == 11
     
     def test_stats_empty_database(self, test_db_session):
         """Test stats with no feedback."""
@@ -616,35 +636,50 @@ class TestGetAdminFeedbackStats:
 
 
 class TestGetAdminFeedbackRelationships:
-    """Tests for eager loading of relationships."""
+    """Tests for eager loading of relationships.
+    
+    Each test expires the session first so relationships populated while the
+    fixtures were built can't mask a missing loader, then asserts that
+    traversing them issues no further queries.
+    """
     
     def test_user_relationship_loaded(self, test_db_session, feedback_data_set):
         """Test that user relationship is eager loaded."""
+        test_db_session.expire_all()
         result = get_admin_feedback(test_db_session, per_page=1)
         
-        # Access user without triggering additional query
         item = result['items'][0]
-        assert item.user is not None
-        assert item.user.github_username == "testuser"
+        with count_queries(test_db_session) as statements:
+            assert item.user is not None
+            assert item.user.github_username == "testuser"
+        assert statements == []
     
     def test_snippet_relationship_loaded(self, test_db_session, feedback_data_set):
         """Test that snippet relationship is eager loaded when present."""
+        test_db_session.expire_all()
         result = get_admin_feedback(test_db_session, target_type="snippet", per_page=1)
         
         item = result['items'][0]
-        assert item.snippet is not None
-        assert item.snippet.code is not None
+        with count_queries(test_db_session) as statements:
+            assert item.snippet is not None
+            assert item.snippet.code is not None
+            assert item.snippet.page is not None
+        assert statements == []
     
     def test_page_relationship_loaded(self, test_db_session, feedback_data_set):
         """Test that page relationship is eager loaded when present."""
+        test_db_session.expire_all()
         result = get_admin_feedback(test_db_session, target_type="page", per_page=1)
         
         item = result['items'][0]
-        assert item.page is not None
-        assert item.page.url is not None
+        with count_queries(test_db_session) as statements:
+            assert item.page is not None
+            assert item.page.url is not None
+        assert statements == []
     
     def test_rewritten_document_relationship_loaded(self, test_db_session, feedback_data_set):
         """Test that rewritten_document relationship is eager loaded when present."""
+        test_db_session.expire_all()
         result = get_admin_feedback(
             test_db_session, 
             target_type="rewritten", 
@@ -652,7 +687,87 @@ class TestGetAdminFeedbackRelationships:
         )
         
         item = result['items'][0]
-        assert item.rewritten_document is not None
+        with count_queries(test_db_session) as statements:
+            assert item.rewritten_document is not None
+            assert item.rewritten_document.page is not None
+        assert statements == []
+    
+    def test_no_lazy_loads_for_full_page(self, test_db_session, feedback_data_set):
+        """Test that a full unfiltered page uses a bounded number of queries and no lazy loads."""
+        test_db_session.expire_all()
+        with count_queries(test_db_session) as statements:
+            result = get_admin_feedback(test_db_session)
+        
+        # stats version + stats + page + user + one IN (...) batch per target and its page
+        assert len(statements) <= 9
+        
+        with count_queries(test_db_session) as statements:
+            for item in result['items']:
+                assert item.user is not None
+                target = item.snippet or item.rewritten_document
+                page = target.page if target is not None else item.page
+                assert page is not None
+        assert statements == []
+
+
+class TestGetAdminFeedbackUserCache:
+    """Tests for the cached feedback authors in get_admin_feedback."""
+    
+    def test_warm_call_skips_user_query(self, test_db_session, feedback_data_set, sample_user):
+        """Test that authors are served from the cache once loaded."""
+        get_admin_feedback(test_db_session)
+        
+        with count_queries(test_db_session) as statements:
+            result = get_admin_feedback(test_db_session)
+        
+        assert not any("from users" in statement.lower() for statement in statements)
+        assert all(item.user.github_username == sample_user.github_username for item in result['items'])
+    
+    def test_attached_users_do_not_dirty_session(self, test_db_session, feedback_data_set):
+        """Test that attaching cached users leaves the session clean."""
+        get_admin_feedback(test_db_session)
+        result = get_admin_feedback(test_db_session)
+        
+        assert result['items'][0].user is not None
+        assert not test_db_session.dirty
+        assert not test_db_session.new
+    
+    def test_user_update_invalidates_cache(self, test_db_session, feedback_data_set, sample_user):
+        """Test that writing a user drops the cached authors."""
+        get_admin_feedback(test_db_session)
+        
+        sample_user.avatar_url = "https://avatars.example.com/updated.png"
+        test_db_session.commit()
+        
+        result = get_admin_feedback(test_db_session)
+        assert result['items'][0].user.avatar_url == "https://avatars.example.com/updated.png"
+
+
+class TestGetAdminFeedbackStatementCache:
+    """Tests that get_admin_feedback statements stay cacheable by SQLAlchemy."""
+    
+    def test_repeated_call_hits_compiled_cache(self, test_db_session, feedback_data_set):
+        """Test that every statement of a repeated call reuses its compiled SQL."""
+        first = get_admin_feedback(test_db_session, rating="up", per_page=2)
+        get_admin_feedback(test_db_session, rating="up", per_page=2, page=2, after=first['pagination']['next_cursor'])
+        
+        cache_hits = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            cache_hits.append(context.cache_hit)
+        
+        connection = test_db_session.get_bind()
+        _feedback_stats_cache.invalidate_all()
+        test_db_session.expire_all()
+        event.listen(connection, "after_cursor_execute", record)
+        try:
+            first = get_admin_feedback(test_db_session, rating="up", per_page=2)
+            get_admin_feedback(test_db_session, rating="up", per_page=2, page=2, after=first['pagination']['next_cursor'])
+        finally:
+            event.remove(connection, "after_cursor_execute", record)
+        
+        assert cache_hits
+        assert all(hit == CACHE_HIT for hit in cache_hits)
 
 
 class TestAdminFeedbackEndpointAuthentication:
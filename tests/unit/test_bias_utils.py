@@ -2,7 +2,7 @@
 Unit tests for shared/utils/bias_utils.py
 """
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import patch
 from shared.utils.bias_utils import (
     get_parsed_mcp_holistic,
     is_page_biased,
@@ -10,336 +10,124 @@ from shared.utils.bias_utils import (
     count_biased_pages,
     get_bias_percentage,
 )
+from tests.fixtures.pages import StubPage, NO_BIAS, ONE_BIAS, TWO_BIAS, THREE_BIAS
 
 
-class TestGetParsedMcpHolistic:
-    """Tests for get_parsed_mcp_holistic function."""
-
-    def test_none_mcp_holistic_returns_none(self):
-        """Page with None mcp_holistic should return None."""
-        page = MagicMock()
-        page.mcp_holistic = None
-        del page._parsed_mcp_holistic  # Ensure no cache
-        assert get_parsed_mcp_holistic(page) is None
-
-    def test_dict_mcp_holistic_returned_directly(self):
-        """Page with dict mcp_holistic should return it directly."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["powershell_only"]}
-        del page._parsed_mcp_holistic
-        result = get_parsed_mcp_holistic(page)
-        assert result == {"bias_types": ["powershell_only"]}
-
-    def test_string_mcp_holistic_parsed(self):
-        """Page with JSON string mcp_holistic should be parsed."""
-        page = MagicMock()
-        page.mcp_holistic = '{"bias_types": ["windows_paths"]}'
-        del page._parsed_mcp_holistic
-        result = get_parsed_mcp_holistic(page)
-        assert result == {"bias_types": ["windows_paths"]}
+# Precomputed inputs for the count/percentage tests, sliced per case. The
+# helpers only read a page (plus a parse cache that is the same every call)
+_BIASED = [StubPage(ONE_BIAS) for _ in range(5)]
+_UNBIASED = [StubPage(NO_BIAS) for _ in range(5)]
 
-    def test_invalid_json_string_returns_none(self):
-        """Page with invalid JSON string should return None."""
-        page = MagicMock()
-        page.mcp_holistic = "not valid json"
-        del page._parsed_mcp_holistic
-        result = get_parsed_mcp_holistic(page)
-        assert result is None
 
-    def test_non_dict_value_returns_none(self):
-        """Page with non-dict mcp_holistic should return None."""
-        page = MagicMock()
-        page.mcp_holistic = ["not", "a", "dict"]
-        del page._parsed_mcp_holistic
-        result = get_parsed_mcp_holistic(page)
-        assert result is None
+class TestGetParsedMcpHolistic:
+    """Tests for get_parsed_mcp_holistic function."""
 
-    def test_caching_behavior(self):
+    @pytest.mark.parametrize("mcp_holistic,expected", [
+        (None, None),
+        ({"bias_types": ["powershell_only"]}, {"bias_types": ["powershell_only"]}),
+        ('{"bias_types": ["windows_paths"]}', {"bias_types": ["windows_paths"]}),
+        ("not valid json", None),
+        (["not", "a", "dict"], None),
+    ], ids=["none", "dict_returned_directly", "json_string_parsed", "invalid_json", "non_dict_value"])
+    def test_get_parsed_mcp_holistic(self, page_factory, mcp_holistic, expected):
+        """Dicts and JSON object strings parse to a dict; anything else gives None."""
+        assert get_parsed_mcp_holistic(page_factory(mcp_holistic)) == expected
+
+    def test_caching_behavior(self, page_factory):
         """Should cache parsed result on page object."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["test"]}
-        del page._parsed_mcp_holistic
+        page = page_factory('{"bias_types": ["test"]}')
+        # Stubs start on the cache-miss path without any attribute deletion
+        assert not hasattr(page, '_parsed_mcp_holistic')
 
         # First call should parse and cache
         result1 = get_parsed_mcp_holistic(page)
         assert result1 == {"bias_types": ["test"]}
-        assert hasattr(page, '_parsed_mcp_holistic')
+        assert page._parsed_mcp_holistic == result1
 
-        # Second call should use cache
-        page._parsed_mcp_holistic = {"cached": True}
-        result2 = get_parsed_mcp_holistic(page)
-        assert result2 == {"cached": True}
+        # Second call should use cache without parsing again
+        with patch('shared.utils.bias_utils.json.loads') as mock_loads:
+            result2 = get_parsed_mcp_holistic(page)
+        mock_loads.assert_not_called()
+        assert result2 is result1
 
 
 class TestIsPageBiased:
     """Tests for is_page_biased function."""
 
-    def test_no_mcp_data_returns_false(self):
-        """Page with no MCP data should return False."""
-        page = MagicMock()
-        page.mcp_holistic = None
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is False
-
-    def test_empty_bias_types_returns_false(self):
-        """Page with empty bias_types (no severity) should return False."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is False
-
-    def test_with_bias_types_returns_true(self):
-        """Page with bias_types (no severity) should return True via fallback."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["powershell_only"]}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-    def test_multiple_bias_types_returns_true(self):
-        """Page with multiple bias_types should return True."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["powershell_only", "windows_paths", "missing_linux"]}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-    def test_string_bias_type_converted_to_list(self):
-        """Page with string bias_types should be handled."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": "powershell_only"}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-    # Severity-based tests (primary indicator)
-    def test_severity_high_returns_true(self):
-        """Page with severity 'high' should return True."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "high", "bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-    def test_severity_medium_returns_true(self):
-        """Page with severity 'medium' should return True."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "medium", "bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-    def test_severity_low_returns_true(self):
-        """Page with severity 'low' should return True."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "low", "bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-    def test_severity_none_returns_false(self):
-        """Page with severity 'none' should return False."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "none", "bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is False
-
-    def test_severity_none_overrides_bias_types(self):
-        """Severity 'none' should take precedence over non-empty bias_types."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "none", "bias_types": ["powershell_only"]}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is False
-
-    def test_severity_high_with_bias_types(self):
-        """Page with severity 'high' and bias_types should return True."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "high", "bias_types": ["powershell_only"]}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-    def test_severity_case_insensitive(self):
-        """Severity comparison should be case-insensitive."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "HIGH", "bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-        page.mcp_holistic = {"severity": "None", "bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is False
-
-    def test_severity_with_whitespace(self):
-        """Severity with whitespace should be handled."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "  high  ", "bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-    def test_empty_string_severity_falls_back_to_bias_types(self):
-        """Empty string severity should fall back to bias_types."""
-        page = MagicMock()
-        page.mcp_holistic = {"severity": "", "bias_types": ["powershell_only"]}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is True
-
-        page.mcp_holistic = {"severity": "", "bias_types": []}
-        del page._parsed_mcp_holistic
-        assert is_page_biased(page) is False
+    @pytest.mark.parametrize("mcp_holistic,expected", [
+        # No data / bias_types fallback
+        (None, False),
+        (NO_BIAS, False),
+        (ONE_BIAS, True),
+        (THREE_BIAS, True),
+        ({"bias_types": "powershell_only"}, True),
+        # Severity is the primary indicator
+        ({"severity": "high", "bias_types": []}, True),
+        ({"severity": "medium", "bias_types": []}, True),
+        ({"severity": "low", "bias_types": []}, True),
+        ({"severity": "none", "bias_types": []}, False),
+        ({"severity": "none", "bias_types": ["powershell_only"]}, False),
+        ({"severity": "high", "bias_types": ["powershell_only"]}, True),
+        ({"severity": "HIGH", "bias_types": []}, True),
+        ({"severity": "None", "bias_types": []}, False),
+        ({"severity": "  high  ", "bias_types": []}, True),
+        # Empty severity falls back to bias_types
+        ({"severity": "", "bias_types": ["powershell_only"]}, True),
+        ({"severity": "", "bias_types": []}, False),
+    ], ids=[
+        "no_mcp_data", "empty_bias_types", "one_bias_type", "multiple_bias_types",
+        "string_bias_type", "severity_high", "severity_medium", "severity_low",
+        "severity_none", "severity_none_overrides_bias_types", "severity_high_with_bias_types",
+        "severity_upper_case", "severity_title_case_none", "severity_with_whitespace",
+        "empty_severity_with_bias_types", "empty_severity_without_bias_types",
+    ])
+    def test_is_page_biased(self, page_factory, mcp_holistic, expected):
+        """Severity decides when present; otherwise non-empty bias_types means biased."""
+        assert is_page_biased(page_factory(mcp_holistic)) is expected
 
 
 class TestGetPagePriority:
     """Tests for get_page_priority function."""
 
-    def test_no_mcp_data_returns_low(self):
-        """Page with no MCP data should return Low priority."""
-        page = MagicMock()
-        page.mcp_holistic = None
-        del page._parsed_mcp_holistic
-        label, score = get_page_priority(page)
-        assert label == "Low"
-        assert score == 1
-
-    def test_empty_bias_types_returns_low(self):
-        """Page with empty bias_types should return Low priority."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": []}
-        del page._parsed_mcp_holistic
-        label, score = get_page_priority(page)
-        assert label == "Low"
-        assert score == 1
-
-    def test_one_bias_type_returns_low(self):
-        """Page with 1 bias type should return Low priority."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["powershell_only"]}
-        del page._parsed_mcp_holistic
-        label, score = get_page_priority(page)
-        assert label == "Low"
-        assert score == 1
-
-    def test_two_bias_types_returns_medium(self):
-        """Page with 2 bias types should return Medium priority."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["powershell_only", "windows_paths"]}
-        del page._parsed_mcp_holistic
-        label, score = get_page_priority(page)
-        assert label == "Medium"
-        assert score == 2
-
-    def test_three_bias_types_returns_high(self):
-        """Page with 3+ bias types should return High priority."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["powershell_only", "windows_paths", "missing_linux"]}
-        del page._parsed_mcp_holistic
-        label, score = get_page_priority(page)
-        assert label == "High"
-        assert score == 3
-
-    def test_many_bias_types_returns_high(self):
-        """Page with many bias types should return High priority."""
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["a", "b", "c", "d", "e"]}
-        del page._parsed_mcp_holistic
-        label, score = get_page_priority(page)
-        assert label == "High"
-        assert score == 3
+    @pytest.mark.parametrize("mcp_holistic,expected", [
+        (None, ("Low", 1)),
+        (NO_BIAS, ("Low", 1)),
+        (ONE_BIAS, ("Low", 1)),
+        (TWO_BIAS, ("Medium", 2)),
+        (THREE_BIAS, ("High", 3)),
+        ({"bias_types": ["a", "b", "c", "d", "e"]}, ("High", 3)),
+    ], ids=["no_mcp_data", "empty_bias_types", "one_bias_type", "two_bias_types", "three_bias_types", "many_bias_types"])
+    def test_get_page_priority(self, page_factory, mcp_holistic, expected):
+        """Priority grows with the number of bias types, capped at High."""
+        assert get_page_priority(page_factory(mcp_holistic)) == expected
 
 
 class TestCountBiasedPages:
     """Tests for count_biased_pages function."""
 
-    def test_empty_list_returns_zero(self):
-        """Empty list should return 0."""
-        assert count_biased_pages([]) == 0
-
-    def test_no_biased_pages_returns_zero(self):
-        """List with no biased pages should return 0."""
-        pages = []
-        for _ in range(3):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": []}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        assert count_biased_pages(pages) == 0
-
-    def test_all_biased_pages(self):
-        """List with all biased pages should return count."""
-        pages = []
-        for _ in range(5):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": ["powershell_only"]}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        assert count_biased_pages(pages) == 5
-
-    def test_mixed_pages(self):
-        """List with mixed pages should return correct count."""
-        pages = []
-        # 3 biased
-        for _ in range(3):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": ["test"]}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        # 2 not biased
-        for _ in range(2):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": []}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        assert count_biased_pages(pages) == 3
+    @pytest.mark.parametrize("biased,not_biased", [
+        (0, 0),
+        (0, 3),
+        (5, 0),
+        (3, 2),
+    ], ids=["empty_list", "no_biased_pages", "all_biased_pages", "mixed_pages"])
+    def test_count_biased_pages(self, biased, not_biased):
+        """Only biased pages are counted."""
+        pages = _BIASED[:biased] + _UNBIASED[:not_biased]
+        assert count_biased_pages(pages) == biased
 
 
 class TestGetBiasPercentage:
     """Tests for get_bias_percentage function."""
 
-    def test_empty_list_returns_zero(self):
-        """Empty list should return 0.0."""
-        assert get_bias_percentage([]) == 0.0
-
-    def test_no_biased_pages_returns_zero(self):
-        """No biased pages should return 0.0."""
-        pages = []
-        for _ in range(4):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": []}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        assert get_bias_percentage(pages) == 0.0
-
-    def test_all_biased_pages_returns_100(self):
-        """All biased pages should return 100.0."""
-        pages = []
-        for _ in range(4):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": ["test"]}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        assert get_bias_percentage(pages) == 100.0
-
-    def test_half_biased_returns_50(self):
-        """Half biased pages should return 50.0."""
-        pages = []
-        # 2 biased
-        for _ in range(2):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": ["test"]}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        # 2 not biased
-        for _ in range(2):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": []}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        assert get_bias_percentage(pages) == 50.0
-
-    def test_percentage_calculation(self):
-        """Should calculate correct percentage."""
-        pages = []
-        # 1 biased out of 4 = 25%
-        page = MagicMock()
-        page.mcp_holistic = {"bias_types": ["test"]}
-        del page._parsed_mcp_holistic
-        pages.append(page)
-        for _ in range(3):
-            page = MagicMock()
-            page.mcp_holistic = {"bias_types": []}
-            del page._parsed_mcp_holistic
-            pages.append(page)
-        assert get_bias_percentage(pages) == 25.0
+    @pytest.mark.parametrize("biased,not_biased,expected", [
+        (0, 0, 0.0),
+        (0, 4, 0.0),
+        (4, 0, 100.0),
+        (2, 2, 50.0),
+        (1, 3, 25.0),
+    ], ids=["empty_list", "no_biased_pages", "all_biased_pages", "half_biased", "one_in_four"])
+    def test_get_bias_percentage(self, biased, not_biased, expected):
+        """Percentage of biased pages, 0.0 for an empty list."""
+        pages = _BIASED[:biased] + _UNBIASED[:not_biased]
+        assert get_bias_percentage(pages) == expected
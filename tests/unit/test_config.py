@@ -1,13 +1,12 @@
 """
 Unit tests for shared/config.py
 """
+import dataclasses
 import pytest
-from unittest.mock import patch, MagicMock
 from shared.config import (
     DatabaseConfig,
     AzureOpenAIConfig,
     RabbitMQConfig,
-    AzureDocsRepo,
     get_repo_from_url,
     is_tracked_repo_url,
 )
@@ -16,33 +15,17 @@ from shared.config import (
 class TestDatabaseConfigParsePgKvConnstr:
     """Tests for DatabaseConfig._parse_pg_kv_connstr method."""
 
-    def test_parses_basic_connection_string(self):
-        """Should parse basic key-value connection string."""
-        connstr = "dbname=mydb user=myuser host=localhost port=5432"
+    @pytest.mark.parametrize("connstr,expected_parts", [
+        ("dbname=mydb user=myuser host=localhost port=5432", ["mydb", "myuser", "localhost", "5432"]),
+        ("dbname=mydb user=myuser host=localhost port=5432 password=secret", ["secret", "postgresql+psycopg2://"]),
+        ("dbname=mydb user=myuser host=localhost port=5432 sslmode=require", ["sslmode=require"]),
+        ("dbname=mydb user=myuser host=localhost", ["5432"]),
+    ], ids=["basic", "with_password", "preserves_sslmode", "defaults_port_to_5432"])
+    def test_parse_pg_kv_connstr(self, connstr, expected_parts):
+        """Should build a SQLAlchemy URL carrying every key-value setting."""
         result = DatabaseConfig._parse_pg_kv_connstr(connstr)
-        assert "mydb" in result
-        assert "myuser" in result
-        assert "localhost" in result
-        assert "5432" in result
-
-    def test_parses_connection_string_with_password(self):
-        """Should parse connection string with password."""
-        connstr = "dbname=mydb user=myuser host=localhost port=5432 password=secret"
-        result = DatabaseConfig._parse_pg_kv_connstr(connstr)
-        assert "secret" in result
-        assert "postgresql+psycopg2://" in result
-
-    def test_parses_connection_string_with_sslmode(self):
-        """Should preserve sslmode setting."""
-        connstr = "dbname=mydb user=myuser host=localhost port=5432 sslmode=require"
-        result = DatabaseConfig._parse_pg_kv_connstr(connstr)
-        assert "sslmode=require" in result
-
-    def test_defaults_port_to_5432(self):
-        """Should default to port 5432 if not specified."""
-        connstr = "dbname=mydb user=myuser host=localhost"
-        result = DatabaseConfig._parse_pg_kv_connstr(connstr)
-        assert "5432" in result
+        for part in expected_parts:
+            assert part in result
 
 
 class TestAzureOpenAIConfig:
@@ -95,164 +78,82 @@ class TestAzureOpenAIConfig:
 class TestRabbitMQConfig:
     """Tests for RabbitMQConfig class."""
 
-    @patch.dict('os.environ', {}, clear=True)
-    def test_defaults(self):
-        """Should have sensible defaults."""
-        config = RabbitMQConfig.from_env()
-        assert config.host == "localhost"
-        assert config.port == 5672
-        assert config.username == "guest"
-        assert config.password == "guest"
-
-    @patch.dict('os.environ', {'RABBITMQ_HOST': 'rabbit.example.com', 'RABBITMQ_PORT': '5673'})
-    def test_from_env_variables(self):
-        """Should read from environment variables."""
-        config = RabbitMQConfig.from_env()
-        assert config.host == "rabbit.example.com"
-        assert config.port == 5673
+    @pytest.mark.parametrize("env,expected", [
+        ({}, {"host": "localhost", "port": 5672, "username": "guest", "password": "guest"}),
+        ({"RABBITMQ_HOST": "rabbit.example.com", "RABBITMQ_PORT": "5673"}, {"host": "rabbit.example.com", "port": 5673}),
+        ({"RABBITMQ_PORT": "tcp://10.0.62.126:5672"}, {"host": "10.0.62.126", "port": 5672}),
+    ], ids=["defaults", "from_env_variables", "tcp_url_port"])
+    def test_from_env(self, monkeypatch, env, expected):
+        """Should read settings from the environment, with sensible defaults."""
+        for key in ("RABBITMQ_HOST", "RABBITMQ_PORT", "RABBITMQ_USERNAME", "RABBITMQ_PASSWORD"):
+            monkeypatch.delenv(key, raising=False)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
 
-    @patch.dict('os.environ', {'RABBITMQ_PORT': 'tcp://10.0.62.126:5672'})
-    def test_parses_tcp_url_format(self):
-        """Should parse TCP URL format for port."""
         config = RabbitMQConfig.from_env()
-        assert config.host == "10.0.62.126"
-        assert config.port == 5672
+        for attr, value in expected.items():
+            assert getattr(config, attr) == value
 
 
 class TestAzureDocsRepo:
     """Tests for AzureDocsRepo class."""
 
-    def test_full_name(self):
+    def test_full_name(self, canonical_repo):
         """Should return owner/name format."""
-        repo = AzureDocsRepo(
-            owner="MicrosoftDocs",
-            name="azure-docs-pr",
-            public_name="azure-docs"
-        )
-        assert repo.full_name == "MicrosoftDocs/azure-docs-pr"
+        assert canonical_repo.full_name == "MicrosoftDocs/azure-docs-pr"
 
-    def test_public_full_name(self):
+    def test_public_full_name(self, canonical_repo):
         """Should return owner/public_name format."""
-        repo = AzureDocsRepo(
-            owner="MicrosoftDocs",
-            name="azure-docs-pr",
-            public_name="azure-docs"
-        )
-        assert repo.public_full_name == "MicrosoftDocs/azure-docs"
-
-    def test_get_scan_url(self):
-        """Should return correct GitHub scan URL."""
-        repo = AzureDocsRepo(
-            owner="MicrosoftDocs",
-            name="azure-docs-pr",
-            public_name="azure-docs",
-            branch="main",
-            articles_path="articles"
-        )
-        expected = "https://github.com/MicrosoftDocs/azure-docs-pr/tree/main/articles"
+        assert canonical_repo.public_full_name == "MicrosoftDocs/azure-docs"
+
+    @pytest.mark.parametrize("overrides,expected", [
+        ({}, "https://github.com/MicrosoftDocs/azure-docs-pr/tree/main/articles"),
+        ({"branch": "develop"}, "https://github.com/MicrosoftDocs/azure-docs-pr/tree/develop/articles"),
+        ({"articles_path": "docs"}, "https://github.com/MicrosoftDocs/azure-docs-pr/tree/main/docs"),
+    ], ids=["defaults", "custom_branch", "custom_articles_path"])
+    def test_get_scan_url(self, canonical_repo, overrides, expected):
+        """Should build the GitHub tree URL from branch and articles path."""
+        repo = dataclasses.replace(canonical_repo, **overrides)
         assert repo.get_scan_url() == expected
 
-    def test_get_scan_url_custom_branch(self):
-        """Should use custom branch in URL."""
-        repo = AzureDocsRepo(
-            owner="MicrosoftDocs",
-            name="azure-docs-pr",
-            public_name="azure-docs",
-            branch="develop"
-        )
-        assert "/tree/develop/" in repo.get_scan_url()
-
-    def test_get_scan_url_custom_articles_path(self):
-        """Should use custom articles path in URL."""
-        repo = AzureDocsRepo(
-            owner="MicrosoftDocs",
-            name="azure-docs-pr",
-            public_name="azure-docs",
-            articles_path="docs"
-        )
-        assert "/docs" in repo.get_scan_url()
-
-    def test_get_raw_url(self):
+    def test_get_raw_url(self, canonical_repo):
         """Should return correct raw.githubusercontent.com URL."""
-        repo = AzureDocsRepo(
-            owner="MicrosoftDocs",
-            name="azure-docs-pr",
-            public_name="azure-docs",
-            branch="main"
-        )
         file_path = "articles/storage/overview.md"
         expected = "https://raw.githubusercontent.com/MicrosoftDocs/azure-docs-pr/main/articles/storage/overview.md"
-        assert repo.get_raw_url(file_path) == expected
+        assert canonical_repo.get_raw_url(file_path) == expected
 
 
+@pytest.mark.usefixtures("tracked_repos")
 class TestGetRepoFromUrl:
     """Tests for get_repo_from_url function."""
 
-    def test_none_url_returns_none(self):
-        """None URL should return None."""
-        assert get_repo_from_url(None) is None
-
-    def test_empty_url_returns_none(self):
-        """Empty URL should return None."""
-        assert get_repo_from_url("") is None
-
-    def test_non_github_url_returns_none(self):
-        """Non-GitHub URL should return None."""
-        assert get_repo_from_url("https://gitlab.com/owner/repo") is None
-
-    @patch('shared.config.AZURE_DOCS_REPOS', [
-        AzureDocsRepo(owner="MicrosoftDocs", name="azure-docs-pr", public_name="azure-docs")
+    @pytest.mark.parametrize("url,expected_name", [
+        (None, None),
+        ("", None),
+        ("https://gitlab.com/owner/repo", None),
+        ("https://github.com/MicrosoftDocs/azure-docs-pr/blob/main/articles/test.md", "azure-docs-pr"),
+        ("https://github.com/MicrosoftDocs/azure-docs/blob/main/articles/test.md", "azure-docs-pr"),
+        ("https://github.com/MICROSOFTDOCS/AZURE-DOCS-PR/blob/main/articles/test.md", "azure-docs-pr"),
+        ("https://github.com/Azure/azure-cli/blob/main/README.md", None),
+    ], ids=[
+        "none_url", "empty_url", "non_github_url", "private_repo_url",
+        "public_repo_url", "case_insensitive", "untracked_repo",
     ])
-    def test_matches_private_repo_url(self):
-        """Should match private repo URL."""
-        url = "https://github.com/MicrosoftDocs/azure-docs-pr/blob/main/articles/test.md"
+    def test_get_repo_from_url(self, url, expected_name):
+        """Tracked private and public repo URLs resolve to the repo; anything else to None."""
         result = get_repo_from_url(url)
-        assert result is not None
-        assert result.name == "azure-docs-pr"
-
-    @patch('shared.config.AZURE_DOCS_REPOS', [
-        AzureDocsRepo(owner="MicrosoftDocs", name="azure-docs-pr", public_name="azure-docs")
-    ])
-    def test_matches_public_repo_url(self):
-        """Should match public repo URL."""
-        url = "https://github.com/MicrosoftDocs/azure-docs/blob/main/articles/test.md"
-        result = get_repo_from_url(url)
-        assert result is not None
-        assert result.public_name == "azure-docs"
-
-    @patch('shared.config.AZURE_DOCS_REPOS', [
-        AzureDocsRepo(owner="MicrosoftDocs", name="azure-docs-pr", public_name="azure-docs")
-    ])
-    def test_case_insensitive_matching(self):
-        """Should match URLs case-insensitively."""
-        url = "https://github.com/MICROSOFTDOCS/AZURE-DOCS-PR/blob/main/articles/test.md"
-        result = get_repo_from_url(url)
-        assert result is not None
-
-    @patch('shared.config.AZURE_DOCS_REPOS', [
-        AzureDocsRepo(owner="MicrosoftDocs", name="azure-docs-pr", public_name="azure-docs")
-    ])
-    def test_untracked_repo_returns_none(self):
-        """Should return None for untracked repos."""
-        url = "https://github.com/Azure/azure-cli/blob/main/README.md"
-        result = get_repo_from_url(url)
-        assert result is None
+        assert (result.name if result else None) == expected_name
 
 
+@pytest.mark.usefixtures("tracked_repos")
 class TestIsTrackedRepoUrl:
     """Tests for is_tracked_repo_url function."""
 
-    @patch('shared.config.AZURE_DOCS_REPOS', [
-        AzureDocsRepo(owner="MicrosoftDocs", name="azure-docs-pr", public_name="azure-docs")
-    ])
     def test_tracked_repo_returns_true(self):
         """Should return True for tracked repo URLs."""
         url = "https://github.com/MicrosoftDocs/azure-docs-pr/blob/main/articles/test.md"
         assert is_tracked_repo_url(url) is True
 
-    @patch('shared.config.AZURE_DOCS_REPOS', [
-        AzureDocsRepo(owner="MicrosoftDocs", name="azure-docs-pr", public_name="azure-docs")
-    ])
     def test_untracked_repo_returns_false(self):
         """Should return False for untracked repo URLs."""
         url = "https://github.com/Azure/azure-cli/blob/main/README.md"
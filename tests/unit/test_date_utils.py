@@ -1,100 +1,107 @@
 """
 Unit tests for shared/utils/date_utils.py
 """
+import re
 import pytest
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock
 from shared.utils.date_utils import (
     get_current_date_mmddyyyy,
     update_ms_date_in_content,
     extract_ms_date_from_content,
 )
 
+_MMDDYYYY_RE = re.compile(r'\A\d{2}/\d{2}/\d{4}\Z')
 
-class TestGetCurrentDateMmddyyyy:
-    """Tests for get_current_date_mmddyyyy function."""
+# Frontmatter samples shared by the update and extract cases
+_FM_BASIC = "---\ntitle: Test\nms.date: 01/15/2024\n---\n\nContent."
+_FM_DQ = '---\nms.date: "03/20/2024"\n---'
+_FM_SQ = "---\nms.date: '03/20/2024'\n---"
+_FM_TIGHT = "---\nms.date:01/15/2024\n---"
+_FM_NO_DATE = "---\ntitle: Test\nms.service: storage\n---\n\nContent."
+_FM_SINGLE_DIGIT = "---\nms.date: 1/5/2024\n---"
+_NO_FRONTMATTER = "Just plain content without any frontmatter."
+_FM_DATE_IN_BODY = "---\ntitle: Test\n---\n\nExample:\n\n    ms.date: 01/15/2024\n"
 
-    def test_returns_correct_format(self):
-        """Should return date in MM/DD/YYYY format."""
-        result = get_current_date_mmddyyyy()
-        # Check format: MM/DD/YYYY
-        import re
-        assert re.match(r'\d{2}/\d{2}/\d{4}', result), f"Expected MM/DD/YYYY format, got {result}"
 
-    def test_returns_current_date(self):
-        """Should return today's date."""
-        result = get_current_date_mmddyyyy()
-        expected = datetime.now().strftime("%m/%d/%Y")
-        assert result == expected
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """
+    Return a function that pins date_utils' clock to the given instant.
 
+    One stand-in clock is installed per test and re-pointed on each call, so
+    tests that need several dates do not patch the module again.
+    """
+    clock = MagicMock()
+    monkeypatch.setattr("shared.utils.date_utils.datetime", clock)
 
-class TestUpdateMsDateInContent:
-    """Tests for update_ms_date_in_content function."""
+    def freeze(instant: datetime) -> datetime:
+        clock.now.return_value = instant
+        return instant
 
-    def test_updates_existing_date(self):
-        """Should update existing ms.date field."""
-        content = """---
-title: Test
-ms.date: 01/01/2023
----
+    return freeze
 
-Content here."""
-        result = update_ms_date_in_content(content, "12/25/2024")
-        assert "ms.date: 12/25/2024" in result
-        assert "01/01/2023" not in result
 
-    def test_updates_date_with_quotes(self):
-        """Should handle ms.date with quotes."""
-        content = """---
-title: Test
-ms.date: "01/01/2023"
----
+class TestGetCurrentDateMmddyyyy:
+    """Tests for get_current_date_mmddyyyy function."""
 
-Content."""
-        result = update_ms_date_in_content(content, "12/25/2024")
-        assert 'ms.date: "12/25/2024"' in result
+    def test_returns_correct_format(self):
+        """Should return date in MM/DD/YYYY format."""
+        # Real clock on purpose; the frozen-clock tests below pin exact values.
+        # \A...\Z checks the whole string, with no trailing newline allowed
+        result = get_current_date_mmddyyyy()
+        assert _MMDDYYYY_RE.match(result), f"Expected MM/DD/YYYY format, got {result}"
 
-    def test_updates_date_with_single_quotes(self):
-        """Should handle ms.date with single quotes."""
-        content = """---
-title: Test
-ms.date: '01/01/2023'
----
+    def test_returns_current_date(self, frozen_now):
+        """Should return today's date."""
+        frozen_now(datetime(2024, 6, 15, 12, 0, 0))
+        assert get_current_date_mmddyyyy() == "06/15/2024"
 
-Content."""
-        result = update_ms_date_in_content(content, "12/25/2024")
-        assert "ms.date: '12/25/2024'" in result
+    def test_zero_pads_month_and_day(self, frozen_now):
+        """Single-digit months and days should be zero-padded."""
+        frozen_now(datetime(2024, 1, 5, 0, 0, 0))
+        assert get_current_date_mmddyyyy() == "01/05/2024"
 
-    def test_handles_different_spacing(self):
-        """Should handle various spacing patterns."""
-        content = """---
-ms.date:01/01/2023
----"""
-        result = update_ms_date_in_content(content, "12/25/2024")
-        assert "12/25/2024" in result
 
-    def test_adds_date_when_missing(self):
-        """Should add ms.date if missing from frontmatter."""
-        content = """---
-title: Test Document
-ms.service: storage
----
+class TestUpdateMsDateInContent:
+    """Tests for update_ms_date_in_content function."""
 
-Content here."""
+    @pytest.mark.parametrize("content,expected,forbidden", [
+        (_FM_BASIC, ["ms.date: 12/25/2024"], ["01/15/2024"]),
+        (_FM_DQ, ['ms.date: "12/25/2024"'], ["03/20/2024"]),
+        (_FM_SQ, ["ms.date: '12/25/2024'"], ["03/20/2024"]),
+        (_FM_TIGHT, ["12/25/2024"], ["01/15/2024"]),
+        (_FM_NO_DATE, ["ms.date: 12/25/2024"], []),
+        # Content unchanged if no frontmatter and no existing ms.date
+        (_NO_FRONTMATTER, [], ["ms.date"]),
+        # Only the frontmatter is edited; body text keeps its example date
+        (_FM_DATE_IN_BODY, ["ms.date: 12/25/2024\n---", "    ms.date: 01/15/2024"], []),
+        # Empty frontmatter still gets the field
+        ("---\n---\nContent.", ["---\nms.date: 12/25/2024\n---\nContent."], []),
+        # A leading byte order mark does not hide the frontmatter
+        ("\ufeff" + _FM_BASIC, ["\ufeff---\ntitle: Test\nms.date: 12/25/2024"], ["01/15/2024"]),
+    ], ids=[
+        "updates_existing_date", "double_quotes", "single_quotes",
+        "different_spacing", "adds_date_when_missing", "no_change_without_frontmatter",
+        "ignores_date_in_body", "adds_date_to_empty_frontmatter",
+        "byte_order_mark",
+    ])
+    def test_update_ms_date(self, content, expected, forbidden):
+        """Should set ms.date to the given date, keeping its quoting."""
         result = update_ms_date_in_content(content, "12/25/2024")
-        assert "ms.date: 12/25/2024" in result
+        for text in expected:
+            assert text in result
+        for text in forbidden:
+            assert text not in result
 
-    def test_no_change_without_frontmatter(self):
-        """Should not modify content without YAML frontmatter."""
-        content = "No frontmatter here, just content."
-        result = update_ms_date_in_content(content, "12/25/2024")
-        # Content unchanged if no frontmatter and no existing ms.date
-        assert "ms.date" not in result
+    def test_same_date_is_not_inserted_again(self):
+        """Should leave content alone when ms.date already has the new date."""
+        result = update_ms_date_in_content(_FM_BASIC, "01/15/2024")
+        assert result == _FM_BASIC
 
-    @patch('shared.utils.date_utils.get_current_date_mmddyyyy')
-    def test_uses_current_date_by_default(self, mock_get_date):
+    def test_uses_current_date_by_default(self, frozen_now):
         """Should use current date if none provided."""
-        mock_get_date.return_value = "06/15/2024"
+        frozen_now(datetime(2024, 6, 15, 12, 0, 0))
         content = """---
 ms.date: 01/01/2023
 ---"""
@@ -105,62 +112,21 @@ ms.date: 01/01/2023
 class TestExtractMsDateFromContent:
     """Tests for extract_ms_date_from_content function."""
 
-    def test_extracts_basic_date(self):
-        """Should extract basic ms.date value."""
-        content = """---
-title: Test
-ms.date: 01/15/2024
----
-
-Content."""
-        result = extract_ms_date_from_content(content)
-        assert result == "01/15/2024"
-
-    def test_extracts_date_with_double_quotes(self):
-        """Should extract date with double quotes."""
-        content = """---
-ms.date: "03/20/2024"
----"""
-        result = extract_ms_date_from_content(content)
-        assert result == "03/20/2024"
-
-    def test_extracts_date_with_single_quotes(self):
-        """Should extract date with single quotes."""
-        content = """---
-ms.date: '03/20/2024'
----"""
-        result = extract_ms_date_from_content(content)
-        assert result == "03/20/2024"
-
-    def test_handles_various_spacing(self):
-        """Should handle various spacing patterns."""
-        content = """---
-ms.date:01/15/2024
----"""
-        result = extract_ms_date_from_content(content)
-        assert result == "01/15/2024"
-
-    def test_returns_none_when_missing(self):
-        """Should return None when ms.date is missing."""
-        content = """---
-title: Test
-ms.service: storage
----
-
-Content."""
-        result = extract_ms_date_from_content(content)
-        assert result is None
-
-    def test_returns_none_for_no_frontmatter(self):
-        """Should return None when no frontmatter exists."""
-        content = "Just plain content without any frontmatter."
-        result = extract_ms_date_from_content(content)
-        assert result is None
-
-    def test_handles_single_digit_dates(self):
-        """Should handle dates with single-digit month/day."""
-        content = """---
-ms.date: 1/5/2024
----"""
-        result = extract_ms_date_from_content(content)
-        assert result == "1/5/2024"
+    @pytest.mark.parametrize("content,expected", [
+        (_FM_BASIC, "01/15/2024"),
+        (_FM_DQ, "03/20/2024"),
+        (_FM_SQ, "03/20/2024"),
+        (_FM_TIGHT, "01/15/2024"),
+        (_FM_NO_DATE, None),
+        (_NO_FRONTMATTER, None),
+        (_FM_SINGLE_DIGIT, "1/5/2024"),
+        (_FM_DATE_IN_BODY, None),
+        ("---\ndescription: Explains ms.date usage\nms.date: 02/03/2024\n---", "02/03/2024"),
+    ], ids=[
+        "basic_date", "double_quotes", "single_quotes", "various_spacing",
+        "missing_date", "no_frontmatter", "single_digit_dates", "date_only_in_body",
+        "key_mentioned_before_field",
+    ])
+    def test_extract_ms_date(self, content, expected):
+        """Should return the unquoted ms.date value, or None when absent."""
+        assert extract_ms_date_from_content(content) == expected
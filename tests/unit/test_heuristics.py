@@ -1,7 +1,13 @@
 """
 Unit tests for packages/scorer/heuristics.py
 """
-from packages.scorer.heuristics import page_has_windows_signals, is_windows_biased, is_windows_intentional_title
+from packages.scorer.heuristics import (
+    page_has_windows_signals,
+    is_windows_biased,
+    is_windows_intentional_title,
+    bulk_is_windows_biased,
+    _lowercase_pattern,
+)
 
 
 class TestPageHasWindowsSignals:
@@ -94,6 +100,17 @@ class TestPageHasWindowsSignals:
         # "Windows" alone is not in PROSE_WINDOWS_PATTERNS
         assert page_has_windows_signals(content) is False
 
+    def test_literal_inside_word_returns_false(self):
+        """A signal literal embedded in a longer word should not count."""
+        # "choco" and "administrator" appear only inside longer words
+        content = "Grab some chocolate while the administrators review the Linux setup."
+        assert page_has_windows_signals(content) is False
+
+    def test_non_ascii_content_keeps_unicode_word_boundaries(self):
+        """Non-ASCII letters next to a literal should still count as word characters."""
+        assert page_has_windows_signals("Lancez choco install sur la machine.") is True
+        assert page_has_windows_signals("Le gâteau échoco est prêt.") is False
+
 
 class TestIsWindowsBiased:
     """Tests for is_windows_biased function."""
@@ -293,3 +310,62 @@ class TestIsWindowsIntentionalTitle:
         assert is_windows_intentional_title("Python quickstart") is False
         assert is_windows_intentional_title("Docker on Azure") is False
         assert is_windows_intentional_title(".NET 6 deployment") is False  # Not .NET Framework
+
+    def test_keyword_inside_word_returns_false(self):
+        """Keywords embedded in other words should not match."""
+        assert is_windows_intentional_title("Upload DSC configurations") is False
+        assert is_windows_intentional_title("Win the race with autoscale") is False
+        assert is_windows_intentional_title("Connect to a Kiis endpoint") is False
+
+    def test_repeated_title_served_from_cache(self):
+        """Repeated titles should be answered from the per-title cache."""
+        is_windows_intentional_title.cache_clear()
+        assert is_windows_intentional_title("Configure Windows Server on Azure") is True
+        assert is_windows_intentional_title("Configure Windows Server on Azure") is True
+        assert is_windows_intentional_title.cache_info().hits == 1
+
+
+class TestBulkIsWindowsBiased:
+    """Tests for bulk_is_windows_biased function."""
+
+    def test_empty_batch_returns_empty_set(self):
+        """Empty batch should flag nothing."""
+        assert bulk_is_windows_biased([]) == set()
+
+    def test_returns_flagged_indices(self):
+        """Should return the indices of biased snippets."""
+        snippets = [
+            {'code': 'ls -la', 'context': ''},
+            {'code': 'choco install package', 'context': ''},
+            {'code': 'az login', 'context': ''},
+            {'code': r'cd C:\Users\admin', 'context': ''},
+        ]
+        assert bulk_is_windows_biased(snippets) == {1, 3}
+
+    def test_matches_single_snippet_heuristic(self):
+        """Should agree with is_windows_biased for every snippet."""
+        snippets = [
+            {'code': 'Get-ChildItem', 'context': 'Using PowerShell'},
+            {'code': 'msiexec /i package.msi', 'context': '', 'url': 'https://docs.microsoft.com/windows/install'},
+            {'code': 'tasklist', 'context': ''},
+            {'code': 'choco install azure-cli', 'context': '', 'windows_header': True},
+            {'code': 'npm install', 'context': ''},
+        ]
+        expected = {idx for idx, snippet in enumerate(snippets) if is_windows_biased(snippet)}
+        assert bulk_is_windows_biased(snippets) == expected
+
+
+class TestLowercasePattern:
+    """Tests for the pattern lowercasing used to build the lowercase-only regexes."""
+
+    def test_lowercases_literal_text(self):
+        """Should fold the literal parts of a pattern."""
+        assert _lowercase_pattern(r'\bWindows Server\b') == r'\bwindows server\b'
+
+    def test_keeps_uppercase_escapes(self):
+        """Should not turn \\S, \\W, \\B or \\D into their lowercase opposites."""
+        assert _lowercase_pattern(r'IIS\S+\W\B\D') == r'iis\S+\W\B\D'
+
+    def test_keeps_escaped_backslash(self):
+        """Should treat an escaped backslash as a literal, not the start of an escape."""
+        assert _lowercase_pattern(r'C:\\Users') == r'c:\\users'
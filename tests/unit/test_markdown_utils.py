@@ -7,6 +7,7 @@ import pytest
 from shared.utils.markdown_utils import (
     extract_title_from_markdown,
     extract_title_from_frontmatter,
+    extract_yaml_frontmatter,
 )
 class TestExtractTitleFromMarkdown:
     """Test cases for extract_title_from_markdown function"""
@@ -79,6 +80,15 @@ Content'''
 Content'''
         assert extract_title_from_markdown(content) == "Main Title"
 
+    def test_no_title_source(self):
+        """Should return empty string without frontmatter title or headings"""
+        content = '''---
+author: seanmck
+---
+
+Plain paragraph text only.'''
+        assert extract_title_from_markdown(content) == ""
+
 
 class TestExtractFrontmatterTitle:
     """Test cases for extract_frontmatter_title function"""
@@ -105,4 +115,31 @@ author: test'''
 date: 2024-01-01'''
         assert extract_title_from_frontmatter(content) is None
 
+    def test_title_key_must_start_the_line(self):
+        """Should ignore keys that only end in 'title:'"""
+        content = '''subtitle: Not this one
+author: test'''
+        assert extract_title_from_frontmatter(content) is None
+
 
+class TestExtractYamlFrontmatter:
+    """Test cases for extract_yaml_frontmatter function"""
+
+    @pytest.mark.parametrize("content,expected", [
+        ("---\ntitle: Test\n---\nBody", "title: Test"),
+        ("---  \r\ntitle: Test\r\n---\r\nBody", "title: Test\r"),
+        ("---\n\ntitle: Test\n---", "title: Test"),
+        ("---\n\n---\nBody", ""),
+        ("# Heading\n---\ntitle: Test\n---", None),
+        ("---\ntitle: Test", None),
+    ], ids=[
+        "basic", "crlf_and_trailing_spaces", "blank_line_after_fence",
+        "empty_block_after_blank_line", "not_at_start", "unclosed",
+    ])
+    def test_extract_yaml_frontmatter(self, content, expected):
+        """Should return the block between the fences, or None"""
+        assert extract_yaml_frontmatter(content) == expected
+
+    def test_long_blank_run_without_closing_fence(self):
+        """Should give up quickly on an unclosed fence followed by blank lines"""
+        assert extract_yaml_frontmatter("---" + "\n" * 50000 + "text") is None
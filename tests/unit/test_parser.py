@@ -202,6 +202,27 @@ line 3</pre>
         assert len(snippets) == 1
         assert snippets[0]['code'] == "nested code"
 
+    def test_excerpt_of_pre_inside_paragraph(self):
+        """Excerpt of a pre nested in a paragraph should come from that paragraph."""
+        html = """
+        <div>
+            <h2>Setup</h2>
+            <p>Run:<pre>az login</pre></p>
+            <p>Other text</p>
+        </div>
+        """
+        snippets = extract_code_snippets(html)
+        assert len(snippets) == 1
+        assert snippets[0]['excerpt'] == "Run:\naz login"
+
+    def test_excerpt_of_pre_inside_unclosed_list_items(self):
+        """Unclosed list items should keep nesting as written for excerpts."""
+        html = "<ul><li>step one<pre>cmd1</pre><li>step two<pre>cmd2</pre></ul>"
+        snippets = extract_code_snippets(html)
+        assert [s['code'] for s in snippets] == ["cmd1", "cmd2"]
+        assert snippets[0]['excerpt'] == "step one\ncmd1\nstep two\ncmd2"
+        assert snippets[1]['excerpt'] == "step two\ncmd2"
+
     def test_snippet_structure(self):
         """Should return snippets with correct structure."""
         html = """
@@ -125,6 +125,28 @@ class TestPRQueries:
         assert result[0]['submitted_at'] == '2024-01-15T11:00:00'
         assert result[0]['merged_at'] == '2024-01-16T14:00:00'
 
+    def test_format_pull_requests_loads_users_in_one_query(self):
+        """Should fetch all PR authors with a single query."""
+        from services.web.src.utils.pr_queries import _format_pull_requests
+
+        prs = []
+        for pr_id, user_id in [(1, 10), (2, 20), (3, 10), (4, None)]:
+            pr = MagicMock(id=pr_id, user_id=user_id, doc_set=None,
+                           created_at=None, submitted_at=None, closed_at=None,
+                           merged_at=None, last_synced_at=None)
+            prs.append(pr)
+        authors = [
+            MagicMock(id=10, github_username="alice", avatar_url="a.png"),
+            MagicMock(id=20, github_username="bob", avatar_url="b.png"),
+        ]
+        mock_db = MagicMock()
+        mock_db.query.return_value.filter.return_value.all.return_value = authors
+
+        result = _format_pull_requests(prs, include_user=True, db=mock_db)
+
+        assert mock_db.query.call_count == 1
+        assert [r['user'] and r['user']['username'] for r in result] == ["alice", "bob", "alice", None]
+
 
 class TestPRModel:
     """Tests for PullRequest model."""
@@ -0,0 +1,70 @@
+"""
+Unit tests for services/worker/src/scoring_service.py
+"""
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture
+def scoring_service():
+    """ScoringService with a pool of two and a stubbed MCP call that counts requests."""
+    with patch('services.worker.src.scoring_service.LLMClient'), \
+            patch('services.worker.src.scoring_service.get_metrics', return_value=MagicMock()):
+        from services.worker.src.scoring_service import ScoringService
+        service = ScoringService(mcp_server_url="http://mcp.test/score_page")
+
+    service.holistic_concurrency = 2
+    service.calls = 0
+    lock = threading.Lock()
+
+    def fake_mcp_call(page_content, page_url):
+        with lock:
+            service.calls += 1
+        time.sleep(0.05)
+        return {"bias_types": [], "url": page_url}
+
+    service.apply_mcp_holistic_scoring = fake_mcp_call
+    return service
+
+
+class TestIterMcpHolisticScoring:
+    """Tests for ScoringService.iter_mcp_holistic_scoring."""
+
+    def test_yields_every_page(self, scoring_service):
+        """Should yield one result per page."""
+        pages = [(f"content {i}", f"https://example.com/{i}") for i in range(5)]
+
+        results = dict(scoring_service.iter_mcp_holistic_scoring(pages))
+
+        assert set(results) == {url for _, url in pages}
+        assert scoring_service.calls == 5
+
+    def test_active_gauge_counts_only_running_requests(self, scoring_service):
+        """Should raise and lower the active-request gauge once per request actually run."""
+        pages = [(f"content {i}", f"https://example.com/{i}") for i in range(10)]
+
+        with pytest.raises(RuntimeError):
+            for _ in scoring_service.iter_mcp_holistic_scoring(pages):
+                raise RuntimeError("commit failed")
+
+        time.sleep(0.2)
+        metrics = scoring_service.metrics
+        assert metrics.record_mcp_request_started.call_count == scoring_service.calls
+        assert metrics.record_mcp_request_finished.call_count == scoring_service.calls
+        metrics.active_mcp_requests.set.assert_not_called()
+
+    def test_consumer_exception_stops_queued_requests(self, scoring_service):
+        """A consumer that raises should cancel requests that have not started."""
+        pages = [(f"content {i}", f"https://example.com/{i}") for i in range(10)]
+
+        with pytest.raises(RuntimeError):
+            for _ in scoring_service.iter_mcp_holistic_scoring(pages):
+                raise RuntimeError("commit failed")
+
+        # Let requests that were already running finish before counting
+        time.sleep(0.2)
+        # Two workers: at most the first two calls plus one each picked up
+        # before the generator was closed
+        assert scoring_service.calls <= 4
@@ -53,6 +53,13 @@ class TestDetectUrlSource:
         # FTP URLs with github.com still get detected as github since we check domain
         assert detect_url_source("ftp://example.com") == "unknown"
 
+    def test_repeated_url_served_from_cache(self):
+        """Repeated URLs should be answered from the per-URL cache."""
+        detect_url_source.cache_clear()
+        assert detect_url_source("https://github.com/MicrosoftDocs/azure-docs") == "github"
+        assert detect_url_source("https://github.com/MicrosoftDocs/azure-docs") == "github"
+        assert detect_url_source.cache_info().hits == 1
+
 
 class TestExtractDocSetFromUrl:
     """Tests for extract_doc_set_from_url function."""